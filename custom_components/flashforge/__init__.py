@@ -7,15 +7,20 @@ from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_IP_ADDRESS, Platform
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 
 from flashforge import FlashForgeClient
 
 from .const import CONF_CHECK_CODE, CONF_SERIAL_NUMBER, DOMAIN
 from .data_update_coordinator import FlashForgeDataUpdateCoordinator
+from .services import async_setup_services
+from .storage import FlashForgeStore
+from .thumbnail_cache import ThumbnailCache
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
 PLATFORMS = [
     Platform.SENSOR,
@@ -29,11 +34,20 @@ PLATFORMS = [
     Platform.CLIMATE,
     Platform.NUMBER,
     Platform.SWITCH,
+    Platform.TEXT,
 ]
 
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up the Flashforge services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Flashforge from a config entry."""
@@ -63,3 +77,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted thumbnails and file list of a deleted printer."""
+    await FlashForgeStore(
+        hass, entry.unique_id or entry.entry_id, ThumbnailCache()
+    ).async_remove()
@@ -9,9 +9,9 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import FlashForgeEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -36,11 +36,12 @@ async def async_setup_entry(
     async_add_entities([FlashForgeDoorSensor(coordinator)])
 
 
-class FlashForgeDoorSensor(CoordinatorEntity, BinarySensorEntity):
+class FlashForgeDoorSensor(FlashForgeEntity, BinarySensorEntity):
     """Door sensor for FlashForge printer."""
 
     _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.DOOR
+    _update_fields = frozenset({"door_open"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize door sensor."""
@@ -52,7 +53,7 @@ class FlashForgeDoorSensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if door is open."""
-        info = self.coordinator.data.get("info")
+        info = self.coordinator.data.info
         if info is None:
             return None
         return info.door_open
@@ -10,6 +10,8 @@ from homeassistant.const import Platform
 from homeassistant.helpers import entity_registry
 
 from . import DOMAIN
+from .commands import CommandPriority
+from .entity import FlashForgeEntity
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -35,7 +37,7 @@ async def async_setup_entry(
 
     async_add_entities(
         [
-            PrinterButton(
+            SafetyPrinterButton(
                 name="pause",
                 icon="mdi:pause",
                 hass=hass,
@@ -49,7 +51,7 @@ async def async_setup_entry(
                 coordinator=coordinator,
                 action=coordinator.client.job_control.resume_print_job,
             ),
-            PrinterButton(
+            SafetyPrinterButton(
                 name="cancel",
                 icon="mdi:stop",
                 hass=hass,
@@ -88,12 +90,14 @@ async def async_setup_entry(
     )
 
 
-class PrinterButton(ButtonEntity):
+class PrinterButton(FlashForgeEntity, ButtonEntity):
     """Representation of a demo button entity."""
 
     _attr_has_entity_name = True
     _attr_name = None
-    _attr_should_poll = False
+    # Buttons have no state; only availability follows the printer
+    _update_fields = frozenset()
+    _priority = CommandPriority.NORMAL
 
     def __init__(
         self,
@@ -104,20 +108,22 @@ class PrinterButton(ButtonEntity):
         action: Callable,
     ) -> None:
         """Initialize the Demo button entity."""
+        super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_{name}"
         self._attr_icon = icon
         self._attr_name = f"{name.replace('_', ' ').title()}"
         self._action = action
         self._attr_device_info = coordinator.device_info
-        self.coordinator = coordinator
 
     async def async_press(self) -> None:
         """Send out a persistent notification."""
         try:
-            result = await self._action()
+            result = await self.coordinator.async_send_command(
+                self._action, priority=self._priority
+            )
             _LOGGER.debug("Flashforge printer responded with: %s", result)
-            # Request coordinator refresh after command
-            await self.coordinator.async_request_refresh()
+            # Poll at the burst cadence to pick up the result
+            self.coordinator.async_start_burst()
         except Exception:
             _LOGGER.exception("Error executing button action: %s")
 
@@ -127,6 +133,12 @@ class PrinterButton(ButtonEntity):
         return self.coordinator.last_update_success
 
 
+class SafetyPrinterButton(PrinterButton):
+    """Printer button whose command jumps ahead of queued commands."""
+
+    _priority = CommandPriority.SAFETY
+
+
 class FilePrinterButton(PrinterButton):
     """Representation of a file print button entity."""
 
@@ -147,9 +159,7 @@ class FilePrinterButton(PrinterButton):
             if not state:
                 _LOGGER.warning("No file selected")
                 return
-            result = await self._action(file_name=state, leveling_before_print=False)
+            result = await self.coordinator.async_print_file(state)
             _LOGGER.debug("Flashforge printer responded with: %s", result)
-            # Request coordinator refresh after command
-            await self.coordinator.async_request_refresh()
         except Exception:
             _LOGGER.exception("Error executing file print action")
@@ -2,23 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from contextlib import closing
+from time import monotonic
 from typing import TYPE_CHECKING
 
-import requests
-from homeassistant.components.camera import Camera
-from homeassistant.helpers.aiohttp_client import (
-    async_aiohttp_proxy_web,
-    async_get_clientsession,
+import aiohttp
+from aiohttp import web
+from homeassistant.components.camera import Camera, CameraEntityFeature
+
+from .const import (
+    CONF_MAX_FPS,
+    CONF_SNAPSHOT_MAX_AGE,
+    CONF_USE_STREAM,
+    DEFAULT_MAX_FPS,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    DOMAIN,
+    MJPEG_FRAME_TIMEOUT,
 )
 
-from .const import DOMAIN
-
 if TYPE_CHECKING:
-    from collections.abc import Iterable
-
-    from aiohttp import web
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -28,27 +31,7 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def extract_image_from_mjpeg(stream: Iterable[bytes]) -> bytes | None:
-    """Take in a MJPEG stream object, return the jpg from it."""
-    data = b""
-
-    for chunk in stream:
-        data += chunk
-        # JPEG End-of-Image marker
-        jpg_end = data.find(b"\xff\xd9")
-
-        if jpg_end == -1:
-            continue
-
-        # JPEG Start-of-Image marker
-        jpg_start = data.find(b"\xff\xd8")
-
-        if jpg_start == -1:
-            continue
-
-        return data[jpg_start : jpg_end + 2]
-    return None
+BOUNDARY = "frame"
 
 
 async def async_setup_entry(
@@ -75,21 +58,30 @@ class FlashForgeCamera(Camera):
         self._attr_name = "Camera"
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_camera"
         self._attr_is_streaming = True
+        if coordinator.config_entry.options.get(CONF_USE_STREAM, False):
+            # Viewers share the segmenting pipeline of the stream integration
+            self._attr_supported_features = CameraEntityFeature.STREAM
 
     @property
     def _mjpeg_url(self) -> str | None:
         """Dynamically retrieve the camera stream URL from the nested FFMachineInfo."""
-        printer_info = self.coordinator.data.get("info")
+        printer_info = self.coordinator.data.info
 
         if printer_info:
             return printer_info.camera_stream_url
 
         return None
 
-    def camera_image(
+    async def stream_source(self) -> str | None:
+        """Return the camera URL for the stream worker, when enabled in options."""
+        if not self.supported_features & CameraEntityFeature.STREAM:
+            return None
+        return self._mjpeg_url
+
+    async def async_camera_image(
         self,
-        width: int | None = None,  # noqa: ARG002
-        height: int | None = None,  # noqa: ARG002
+        width: int | None = None,
+        height: int | None = None,
     ) -> bytes | None:
         """Return a still image response from the camera."""
         mjpeg_url = self._mjpeg_url
@@ -102,15 +94,19 @@ class FlashForgeCamera(Camera):
             )
             return None
 
+        max_age = self.coordinator.config_entry.options.get(
+            CONF_SNAPSHOT_MAX_AGE, DEFAULT_SNAPSHOT_MAX_AGE
+        )
+        hub = self.coordinator.stream_hub
         try:
-            # Use the dynamically fetched URL
-            req = requests.get(mjpeg_url, stream=True, timeout=10)
-
-            with closing(req) as response:
-                return extract_image_from_mjpeg(response.iter_content(102400))
-        except requests.exceptions.ConnectionError:
+            frame = await hub.async_get_frame(mjpeg_url, max_age)
+        except (TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.debug("Could not read a frame from %s: %s", mjpeg_url, err)
             self._attr_is_streaming = False
             return None
+        if frame is None or width is None or height is None:
+            return frame
+        return await hub.async_scale(frame, width, height)
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
@@ -126,12 +122,39 @@ class FlashForgeCamera(Camera):
             )
             return None
 
-        # connect to stream
-        websession = async_get_clientsession(self.hass)
-        # Use the dynamically fetched URL
-        stream_coro = websession.get(mjpeg_url)
-
-        return await async_aiohttp_proxy_web(self.hass, request, stream_coro)
+        response = web.StreamResponse(
+            headers={"Content-Type": f"multipart/x-mixed-replace;boundary={BOUNDARY}"}
+        )
+        await response.prepare(request)
+        interval = 1 / self.coordinator.config_entry.options.get(
+            CONF_MAX_FPS, DEFAULT_MAX_FPS
+        )
+        sent_at = 0.0
+        # All viewers share the one upstream connection of the stream hub
+        async with self.coordinator.stream_hub.async_subscribe(mjpeg_url) as frames:
+            while True:
+                # A stalled camera would otherwise hold the response open, and
+                # a viewer that left would never be noticed
+                try:
+                    async with asyncio.timeout(MJPEG_FRAME_TIMEOUT):
+                        frame = await frames.get()
+                except TimeoutError:
+                    _LOGGER.debug("Camera stream %s stalled", mjpeg_url)
+                    break
+                if frame is None:
+                    break
+                if (now := monotonic()) - sent_at < interval:
+                    continue
+                sent_at = now
+                try:
+                    await response.write(
+                        b"--%s\r\nContent-Type: image/jpeg\r\n"
+                        b"Content-Length: %d\r\n\r\n%s\r\n"
+                        % (BOUNDARY.encode(), len(frame), frame)
+                    )
+                except ConnectionResetError:
+                    break
+        return response
 
     @property
     def available(self) -> bool:
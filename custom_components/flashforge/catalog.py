@@ -0,0 +1,174 @@
+"""Indexed catalog of the G-code files stored on a FlashForge printer."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from dataclasses import dataclass
+from time import monotonic, time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import FILE_LIST_INTERVAL
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from flashforge import FFGcodeFileEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Folder the printer reports its local files in
+_FILE_PREFIX = "/data/"
+
+
+def file_name(path: str) -> str:
+    """Return the name a file is shown and printed by."""
+    return path.removeprefix(_FILE_PREFIX)
+
+
+@dataclass(slots=True)
+class CatalogEntry:
+    """A file on the printer with the metadata known about it."""
+
+    path: str
+    # Estimated print time (seconds) and filament (grams), from the printer's
+    # recent file list
+    printing_time: int | None = None
+    filament_weight: float | None = None
+    # None until a thumbnail was requested for the file
+    has_thumbnail: bool | None = None
+    # When the file was last printed or uploaded (epoch seconds)
+    last_used: float = 0.0
+
+    @property
+    def name(self) -> str:
+        """Return the name of the file."""
+        return file_name(self.path)
+
+
+def _recent_first(entry: CatalogEntry) -> tuple[float, str]:
+    """Sort key putting the most recently used files first, then by name."""
+    return (-entry.last_used, entry.name.casefold())
+
+
+class FileCatalog:
+    """Index the printer's files by name and apply file list changes as diffs."""
+
+    def __init__(self, interval: float = FILE_LIST_INTERVAL) -> None:
+        """Initialize an empty catalog."""
+        self.interval = interval
+        # Bumped on every change to the set of files
+        self.version = 0
+        # Bumped on every change to the set of files or to their recent order
+        self.revision = 0
+        self.syncs = 0
+        self._entries: dict[str, CatalogEntry] = {}
+        self._fingerprint = hash(frozenset())
+        self._paths: tuple[str, ...] = ()
+        self._synced_at: float | None = None
+
+    def __contains__(self, name: object) -> bool:
+        """Return True if the printer holds a file by that name."""
+        return name in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of files."""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[CatalogEntry]:
+        """Iterate over the files."""
+        return iter(self._entries.values())
+
+    def get(self, name: str) -> CatalogEntry | None:
+        """Return the entry of a file by name."""
+        return self._entries.get(name)
+
+    def search(self, query: str = "", limit: int | None = None) -> list[CatalogEntry]:
+        """Return the files whose name contains the query, most recently used first."""
+        needle = query.strip().casefold()
+        matches = (
+            entry for entry in self._entries.values() if needle in entry.name.casefold()
+        )
+        if limit is None:
+            return sorted(matches, key=_recent_first)
+        return heapq.nsmallest(limit, matches, key=_recent_first)
+
+    @property
+    def paths(self) -> tuple[str, ...]:
+        """Return the file paths as the printer reports them."""
+        return self._paths
+
+    @property
+    def fingerprint(self) -> int:
+        """Return a hash of the set of files, independent of their order."""
+        return self._fingerprint
+
+    def refresh_due(self) -> bool:
+        """Return True if the file list should be fetched from the printer."""
+        return self._synced_at is None or monotonic() - self._synced_at >= self.interval
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Fetch the file list on the next update, e.g. after an upload or print."""
+        self._synced_at = None
+
+    @callback
+    def async_sync(self, paths: Iterable[str], *, complete: bool = True) -> bool:
+        """
+        Apply a file list from the printer, returning True if it changed.
+
+        Only added and removed files are touched, so metadata of the files that
+        stayed is kept. A list restored from storage is applied with complete
+        set to False, which leaves the next update to fetch a fresh one.
+        """
+        paths = tuple(paths)
+        if complete:
+            self._synced_at = monotonic()
+            self.syncs += 1
+        if (fingerprint := hash(frozenset(paths))) == self._fingerprint:
+            return False
+
+        names = {file_name(path): path for path in paths}
+        removed = self._entries.keys() - names.keys()
+        added = names.keys() - self._entries.keys()
+        for name in removed:
+            del self._entries[name]
+        for name in added:
+            self._entries[name] = CatalogEntry(names[name])
+        self._paths = paths
+        self._fingerprint = fingerprint
+        self.version += 1
+        self.revision += 1
+        _LOGGER.debug(
+            "File list changed: %s added, %s removed", len(added), len(removed)
+        )
+        return True
+
+    @callback
+    def async_update_details(self, details: Iterable[FFGcodeFileEntry]) -> None:
+        """Merge metadata from the printer's recent file list, most recent first."""
+        now = time()
+        for rank, detail in enumerate(details):
+            if (entry := self._entries.get(file_name(detail.gcode_file_name))) is None:
+                continue
+            entry.printing_time = detail.printing_time or None
+            entry.filament_weight = detail.total_filament_weight
+            # Keep the printer's order among files it lists as recent
+            if (last_used := now - rank) > entry.last_used:
+                entry.last_used = last_used
+                self.revision += 1
+
+    @callback
+    def async_mark_used(self, name: str) -> None:
+        """Record that a file was just printed or uploaded."""
+        if (entry := self._entries.get(name)) is not None:
+            entry.last_used = time()
+            self.revision += 1
+
+    @callback
+    def async_set_thumbnail(self, name: str, *, present: bool) -> None:
+        """Record whether a file has a thumbnail."""
+        if (entry := self._entries.get(name)) is not None:
+            entry.has_thumbnail = present
@@ -0,0 +1,67 @@
+"""Circuit breaker for unreachable FlashForge printers."""
+
+from __future__ import annotations
+
+import logging
+from enum import StrEnum
+
+from .const import MAX_FAILED_UPDATES, SCAN_INTERVAL_OFFLINE, SCAN_INTERVAL_OFFLINE_MAX
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BreakerState(StrEnum):
+    """State of a circuit breaker."""
+
+    # Polling normally
+    CLOSED = "closed"
+    # Unreachable; only cheap liveness probes, at a backed off interval
+    OPEN = "open"
+    # The probe succeeded; the next full poll decides
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop polling a printer that keeps failing until it answers again."""
+
+    def __init__(
+        self,
+        threshold: int = MAX_FAILED_UPDATES,
+        base_delay: float = SCAN_INTERVAL_OFFLINE,
+        max_delay: float = SCAN_INTERVAL_OFFLINE_MAX,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.threshold = threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.state = BreakerState.CLOSED
+        # Consecutive failed polls or probes
+        self.failures = 0
+        # Consecutive times the breaker opened without closing in between
+        self.trips = 0
+
+    @property
+    def retry_delay(self) -> float:
+        """Return the delay before the next probe, doubling with every trip."""
+        return min(self.base_delay * 2 ** max(self.trips - 1, 0), self.max_delay)
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful poll."""
+        if self.state is not BreakerState.CLOSED:
+            _LOGGER.info("Printer is reachable again")
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.trips = 0
+
+    def record_failure(self) -> None:
+        """Count a failed poll or probe, opening the breaker when over threshold."""
+        self.failures += 1
+        if self.state is BreakerState.HALF_OPEN or self.failures >= self.threshold:
+            if self.state is BreakerState.CLOSED:
+                _LOGGER.info("Printer unreachable, backing off")
+            self.state = BreakerState.OPEN
+            self.trips += 1
+
+    def half_open(self) -> None:
+        """Let a probe through after the retry delay passed."""
+        self.state = BreakerState.HALF_OPEN
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from homeassistant.components.climate import ClimateEntity
@@ -10,6 +11,8 @@ from homeassistant.components.climate.const import ClimateEntityFeature, HVACMod
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 
 from . import DOMAIN
+from .commands import CommandPriority
+from .entity import FlashForgeEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -39,7 +42,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class FlashForgeBedClimate(ClimateEntity):
+class FlashForgeBedClimate(FlashForgeEntity, ClimateEntity):
     """Representation of the heated bed as a climate entity."""
 
     _attr_has_entity_name = True
@@ -48,10 +51,11 @@ class FlashForgeBedClimate(ClimateEntity):
     _attr_hvac_modes: ClassVar[list[HVACMode]] = [HVACMode.OFF, HVACMode.HEAT]
     _attr_min_temp = 0
     _attr_max_temp = 120
+    _update_fields = frozenset({"print_bed"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the bed climate entity."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_bed_climate"
         self._attr_name = "Bed"
         self._attr_device_info = coordinator.device_info
@@ -59,18 +63,18 @@ class FlashForgeBedClimate(ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        info = self.coordinator.data.get("info")
-        if info and hasattr(info, "bed_temperature"):
-            return float(info.bed_temperature)
-        return None
+        info = self.coordinator.data.info
+        if info is None:
+            return None
+        return info.print_bed.current
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        info = self.coordinator.data.get("info")
-        if info and hasattr(info, "target_bed_temperature"):
-            return float(info.target_bed_temperature)
-        return None
+        info = self.coordinator.data.info
+        if info is None:
+            return None
+        return info.print_bed.set
 
     @property
     def hvac_mode(self) -> HVACMode:
@@ -85,10 +89,14 @@ class FlashForgeBedClimate(ClimateEntity):
             return
 
         try:
-            await self.coordinator.client.temp_control.set_bed_temp(
-                int(temperature), wait_for=False
+            await self.coordinator.async_send_command(
+                partial(
+                    self.coordinator.client.temp_control.set_bed_temp,
+                    int(temperature),
+                    wait_for=False,
+                )
             )
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_start_burst()
         except Exception:
             _LOGGER.exception("Error setting bed temperature")
 
@@ -96,13 +104,20 @@ class FlashForgeBedClimate(ClimateEntity):
         """Set new HVAC mode."""
         try:
             if hvac_mode == HVACMode.OFF:
-                await self.coordinator.client.temp_control.cancel_bed_temp()
+                await self.coordinator.async_send_command(
+                    self.coordinator.client.temp_control.cancel_bed_temp,
+                    priority=CommandPriority.SAFETY,
+                )
             elif hvac_mode == HVACMode.HEAT:
                 # Set to a default temperature if turning on
-                await self.coordinator.client.temp_control.set_bed_temp(
-                    60, wait_for=False
+                await self.coordinator.async_send_command(
+                    partial(
+                        self.coordinator.client.temp_control.set_bed_temp,
+                        60,
+                        wait_for=False,
+                    )
                 )
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_start_burst()
         except Exception:
             _LOGGER.exception("Error setting bed HVAC mode")
 
@@ -112,7 +127,7 @@ class FlashForgeBedClimate(ClimateEntity):
         return self.coordinator.last_update_success
 
 
-class FlashForgeNozzleClimate(ClimateEntity):
+class FlashForgeNozzleClimate(FlashForgeEntity, ClimateEntity):
     """Representation of the nozzle/extruder as a climate entity."""
 
     _attr_has_entity_name = True
@@ -121,10 +136,11 @@ class FlashForgeNozzleClimate(ClimateEntity):
     _attr_hvac_modes: ClassVar[list[HVACMode]] = [HVACMode.OFF, HVACMode.HEAT]
     _attr_min_temp = 0
     _attr_max_temp = 300
+    _update_fields = frozenset({"extruder"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the nozzle climate entity."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_nozzle_climate"
         self._attr_name = "Extruder"
         self._attr_device_info = coordinator.device_info
@@ -132,18 +148,18 @@ class FlashForgeNozzleClimate(ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        info = self.coordinator.data.get("info")
-        if info and hasattr(info, "left_extruder_temperature"):
-            return float(info.left_extruder_temperature)
-        return None
+        info = self.coordinator.data.info
+        if info is None:
+            return None
+        return info.extruder.current
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        info = self.coordinator.data.get("info")
-        if info and hasattr(info, "target_left_extruder_temperature"):
-            return float(info.target_left_extruder_temperature)
-        return None
+        info = self.coordinator.data.info
+        if info is None:
+            return None
+        return info.extruder.set
 
     @property
     def hvac_mode(self) -> HVACMode:
@@ -158,10 +174,14 @@ class FlashForgeNozzleClimate(ClimateEntity):
             return
 
         try:
-            await self.coordinator.client.temp_control.set_extruder_temp(
-                int(temperature), wait_for=False
+            await self.coordinator.async_send_command(
+                partial(
+                    self.coordinator.client.temp_control.set_extruder_temp,
+                    int(temperature),
+                    wait_for=False,
+                )
             )
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_start_burst()
         except Exception:
             _LOGGER.exception("Error setting nozzle temperature")
 
@@ -169,13 +189,20 @@ class FlashForgeNozzleClimate(ClimateEntity):
         """Set new HVAC mode."""
         try:
             if hvac_mode == HVACMode.OFF:
-                await self.coordinator.client.temp_control.cancel_extruder_temp()
+                await self.coordinator.async_send_command(
+                    self.coordinator.client.temp_control.cancel_extruder_temp,
+                    priority=CommandPriority.SAFETY,
+                )
             elif hvac_mode == HVACMode.HEAT:
                 # Set to a default temperature if turning on
-                await self.coordinator.client.temp_control.set_extruder_temp(
-                    200, wait_for=False
+                await self.coordinator.async_send_command(
+                    partial(
+                        self.coordinator.client.temp_control.set_extruder_temp,
+                        200,
+                        wait_for=False,
+                    )
                 )
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_start_burst()
         except Exception:
             _LOGGER.exception("Error setting nozzle HVAC mode")
 
@@ -0,0 +1,177 @@
+"""Command handling for FlashForge printers."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from enum import IntEnum
+from functools import partial
+from itertools import count
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+
+from .const import COMMAND_COALESCE_DELAY, COMMAND_TIMEOUT
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandPriority(IntEnum):
+    """Order in which queued commands reach the printer, lowest first."""
+
+    SAFETY = 0
+    NORMAL = 1
+    COSMETIC = 2
+
+
+class CommandQueue:
+    """Serialize the commands sent to one printer, by priority."""
+
+    def __init__(self, timeout: float = COMMAND_TIMEOUT) -> None:
+        """Initialize an idle queue."""
+        self.timeout = timeout
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+        self._busy = False
+        self._sequence = count()
+        # Heap of (priority, sequence, future) of commands waiting their turn
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+
+    @property
+    def depth(self) -> int:
+        """Return the number of commands waiting or being sent."""
+        waiting = sum(not future.done() for _, _, future in self._waiters)
+        return waiting + self._busy
+
+    @property
+    def average_latency(self) -> float:
+        """Return the mean time from queueing to completion of a command."""
+        return self._total_latency / self.completed if self.completed else 0.0
+
+    async def async_execute(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        priority: CommandPriority = CommandPriority.NORMAL,
+    ) -> Any:
+        """Send a command once all queued commands of higher priority are sent."""
+        start = monotonic()
+        try:
+            # The deadline covers both the wait in the queue and the command
+            async with asyncio.timeout(self.timeout):
+                await self._async_acquire(priority)
+                try:
+                    result = await func(*args)
+                finally:
+                    self._release()
+        except TimeoutError:
+            self.timed_out += 1
+            _LOGGER.debug("Command %s timed out", getattr(func, "__name__", func))
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        latency = monotonic() - start
+        self.completed += 1
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self._total_latency += latency
+        return result
+
+    async def _async_acquire(self, priority: CommandPriority) -> None:
+        """Wait until it is this command's turn."""
+        if not self._busy:
+            self._busy = True
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The turn was handed over just before the cancellation
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the printer over to the next waiting command, if any."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
+
+    def stats(self) -> dict[str, Any]:
+        """Return the queue metrics."""
+        return {
+            "depth": self.depth,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "last_latency": round(self.last_latency, 3),
+            "average_latency": round(self.average_latency, 3),
+            "max_latency": round(self.max_latency, 3),
+        }
+
+
+class CommandCoalescer:
+    """Send only the last of rapidly repeated commands for each control."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: Callable[[Callable[[], Awaitable[Any]]], Awaitable[Any]],
+        confirm: Callable[[], None],
+        delay: float = COMMAND_COALESCE_DELAY,
+    ) -> None:
+        """Initialize the coalescer; confirm runs once after each sent command."""
+        self._hass = hass
+        self._send = send
+        self._confirm = confirm
+        self._delay = delay
+        self._pending: dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._debouncers: dict[str, Debouncer] = {}
+
+    async def async_send(self, key: str, command: Callable[[], Awaitable[Any]]) -> None:
+        """Queue a command, replacing any unsent command for the same key."""
+        self._pending[key] = command
+        if (debouncer := self._debouncers.get(key)) is None:
+            debouncer = self._debouncers[key] = Debouncer(
+                self._hass,
+                _LOGGER,
+                cooldown=self._delay,
+                immediate=False,
+                function=partial(self._async_flush, key),
+            )
+        await debouncer.async_call()
+
+    async def _async_flush(self, key: str) -> None:
+        """Send the last queued command for a key and confirm its effect."""
+        if (command := self._pending.pop(key, None)) is None:
+            return
+        try:
+            await self._send(command)
+        except Exception:
+            _LOGGER.exception("Error sending %s command", key)
+            return
+        self._confirm()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop unsent commands."""
+        self._pending.clear()
+        for debouncer in self._debouncers.values():
+            debouncer.async_shutdown()
@@ -11,7 +11,16 @@ from homeassistant.core import callback
 
 from flashforge import FlashForgeClient, FlashForgePrinterDiscovery
 
-from .const import CONF_CHECK_CODE, CONF_SERIAL_NUMBER, DOMAIN
+from .const import (
+    CONF_CHECK_CODE,
+    CONF_MAX_FPS,
+    CONF_SERIAL_NUMBER,
+    CONF_SNAPSHOT_MAX_AGE,
+    CONF_USE_STREAM,
+    DEFAULT_MAX_FPS,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +36,14 @@ class FlashForgeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     machine_name: str
     client: FlashForgeClient
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> config_entries.OptionsFlowWithReload:
+        """Return the options flow."""
+        return FlashForgeOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -185,3 +202,35 @@ class FlashForgeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_CHECK_CODE: self.check_code,
             },
         )
+
+
+class FlashForgeOptionsFlow(config_entries.OptionsFlowWithReload):
+    """Options flow; the entry reloads so the camera picks up its mode."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the camera options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SNAPSHOT_MAX_AGE,
+                    default=options.get(
+                        CONF_SNAPSHOT_MAX_AGE, DEFAULT_SNAPSHOT_MAX_AGE
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                vol.Optional(
+                    CONF_MAX_FPS,
+                    default=options.get(CONF_MAX_FPS, DEFAULT_MAX_FPS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=30)),
+                vol.Optional(
+                    CONF_USE_STREAM,
+                    default=options.get(CONF_USE_STREAM, False),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=data_schema)
@@ -0,0 +1,118 @@
+"""Connection lifecycle of a FlashForge printer client."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.const import APPLICATION_NAME, __version__
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    CONNECT_RETRIES,
+    CONNECT_RETRY_DELAY,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_TIMEOUT,
+    KEEPALIVE_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from flashforge import FlashForgeClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FlashForgeConnection:
+    """Keep the control connection and HTTP connection pool of a printer open."""
+
+    def __init__(self, hass: HomeAssistant, client: FlashForgeClient) -> None:
+        """Initialize the connection manager of a client."""
+        self.hass = hass
+        self.client = client
+        self.connected = False
+        self.connects = 0
+        self._unsub_keepalive: CALLBACK_TYPE | None = None
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session of this printer, with its own connection pool."""
+        if self._session is None or self._session.closed:
+            # The shared Home Assistant pool allows far more connections per
+            # host than a printer serves; idle ones are kept open for reuse
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=HTTP_MAX_CONNECTIONS,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                ),
+                timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+                headers={"User-Agent": f"{APPLICATION_NAME}/{__version__}"},
+            )
+        return self._session
+
+    async def async_connect(self, attempts: int = CONNECT_RETRIES) -> None:
+        """Verify the printer answers, retrying with a growing delay."""
+        for attempt in range(attempts):
+            if attempt:
+                await asyncio.sleep(CONNECT_RETRY_DELAY * 2 ** (attempt - 1))
+            if await self.client.initialize():
+                break
+            _LOGGER.debug(
+                "Connecting to %s failed, attempt %s of %s",
+                self.client.ip_address,
+                attempt + 1,
+                attempts,
+            )
+        else:
+            self.connected = False
+            msg = f"Could not connect to {self.client.ip_address}"
+            raise ConnectionError(msg)
+
+        self.connected = True
+        self.connects += 1
+        if self._unsub_keepalive is None:
+            self._unsub_keepalive = async_track_time_interval(
+                self.hass,
+                self._async_keep_alive,
+                timedelta(seconds=KEEPALIVE_INTERVAL),
+                name=f"flashforge keepalive {self.client.ip_address}",
+                cancel_on_shutdown=True,
+            )
+
+    @callback
+    def async_mark_lost(self) -> None:
+        """Stop reviving the control connection of an unreachable printer."""
+        self.connected = False
+
+    async def _async_keep_alive(self, _now: datetime) -> None:
+        """Restart the client keepalive if it gave up after a failed command."""
+        if not self.connected:
+            return
+        # A no-op while the keepalive runs; otherwise its first status command
+        # reconnects the control socket
+        await self.client.tcp_client.start_keep_alive()
+
+    async def async_close(self) -> None:
+        """Stop the keepalive and close the TCP and HTTP connections."""
+        if self._unsub_keepalive is not None:
+            self._unsub_keepalive()
+            self._unsub_keepalive = None
+        self.connected = False
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        try:
+            await self.client.dispose()
+        except (TimeoutError, OSError) as err:
+            _LOGGER.debug(
+                "Closing the connection to %s failed: %s", self.client.ip_address, err
+            )
@@ -5,6 +5,120 @@ DEFAULT_NAME = "FlashForge"
 
 CONF_SERIAL_NUMBER = "serial_number"
 CONF_CHECK_CODE = "check_code"
+CONF_SNAPSHOT_MAX_AGE = "snapshot_max_age"
+CONF_MAX_FPS = "max_fps"
+CONF_USE_STREAM = "use_stream"
+
+SERVICE_PRINT_FILE = "print_file"
+SERVICE_UPLOAD_FILE = "upload_file"
+ATTR_FILE_NAME = "file_name"
+ATTR_FILE_PATH = "file_path"
+ATTR_LEVELING_BEFORE_PRINT = "leveling_before_print"
+ATTR_START_PRINT = "start_print"
+
+# Fired while a file is uploaded to a printer
+EVENT_UPLOAD_PROGRESS = f"{DOMAIN}_upload_progress"
+
+# Age (seconds) up to which a camera frame is reused for snapshots, and the
+# frame rate each viewer of a camera stream is capped at
+DEFAULT_SNAPSHOT_MAX_AGE = 2
+DEFAULT_MAX_FPS = 10
 
 SCAN_INTERVAL = 30
 MAX_FAILED_UPDATES = 3
+
+# Adaptive polling cadence (seconds), picked from the printer's machine state
+SCAN_INTERVAL_ACTIVE = 5
+SCAN_INTERVAL_IDLE = SCAN_INTERVAL
+SCAN_INTERVAL_OFFLINE = 60
+SCAN_INTERVAL_OFFLINE_MAX = 600
+SCAN_INTERVAL_BURST = 2
+BURST_POLL_COUNT = 3
+
+# Deadline (seconds) shared by all printer requests of one update cycle
+UPDATE_TIMEOUT = 10
+
+# Thumbnail cache budget per printer (bytes), and how long (seconds) a file
+# without a thumbnail is remembered before asking the printer again
+THUMBNAIL_CACHE_MAX_BYTES = 4 * 1024 * 1024
+THUMBNAIL_RETRY_INTERVAL = 300
+
+# Persistent store of thumbnails and file metadata under .storage
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60
+STORAGE_MAX_AGE = 30 * 24 * 3600
+
+# Window (seconds) in which repeated slider commands collapse into one
+COMMAND_COALESCE_DELAY = 0.5
+
+# Deadline (seconds) for a command, including its wait in the command queue
+COMMAND_TIMEOUT = 15
+
+# How long (seconds) an optimistic state waits for a poll to confirm it
+OPTIMISTIC_CONFIRM_WINDOW = 10
+
+# Fleet-wide polling: printer requests in flight across all printers, the
+# random spread (fraction of the interval) added to every poll, and the
+# window (seconds) over which poll throughput is reported
+FLEET_MAX_CONCURRENT_REQUESTS = 8
+FLEET_POLL_JITTER = 0.1
+FLEET_THROUGHPUT_WINDOW = 60
+
+# Timeout (seconds) of the TCP connect to the printer's HTTP port that checks
+# an unreachable printer is back before a full poll is attempted
+PROBE_TIMEOUT = 2
+PRINTER_HTTP_PORT = 8898
+
+# Attempts to connect to a printer, the delay (seconds) before the first retry,
+# doubling after it, and how often (seconds) a dropped keepalive is restarted
+CONNECT_RETRIES = 3
+CONNECT_RETRY_DELAY = 1
+KEEPALIVE_INTERVAL = 30
+
+# HTTP connection pool of each printer: connections open at once, how long
+# (seconds) an idle one is kept for reuse, and the default request timeout
+HTTP_MAX_CONNECTIONS = 4
+HTTP_KEEPALIVE_TIMEOUT = 60
+HTTP_TIMEOUT = 10
+
+# Deadline (seconds) for reading a still image off the camera stream
+CAMERA_SNAPSHOT_TIMEOUT = 5
+
+# Bytes an MJPEG stream may send without completing a frame before the
+# parser drops them
+MJPEG_MAX_FRAME_SIZE = 4 * 1024 * 1024
+
+# Frames buffered for each viewer of a camera stream; a slower viewer skips
+# the oldest ones
+MJPEG_VIEWER_QUEUE_SIZE = 2
+
+# How long (seconds) a viewer waits for the next frame before the camera
+# stream is treated as stalled and closed
+MJPEG_FRAME_TIMEOUT = 15
+
+# Camera frames downscaled in the executor at once
+CAMERA_SCALE_WORKERS = 2
+
+# How often (seconds) the file list is fetched; uploads and prints started
+# from elsewhere refresh it sooner
+FILE_LIST_INTERVAL = 300
+
+# Files offered by the file select at once, most recently used first
+FILE_SELECT_WINDOW = 25
+
+# Uploads: bytes read from disk at a time, progress (percent) between two
+# progress events, how long (seconds) the printer may take to answer once the
+# file is sent, and the slowest transfer rate (bytes per second) the deadline
+# of an upload allows for
+UPLOAD_CHUNK_SIZE = 256 * 1024
+UPLOAD_PROGRESS_STEP = 5
+UPLOAD_RESPONSE_TIMEOUT = 120
+UPLOAD_MIN_RATE = 32 * 1024
+
+# Uploads of one file to several printers: printers sent to at once, sharing
+# one read of the file, chunks buffered for the slowest of them, and further
+# attempts (with the delay in seconds before each) for a printer that failed
+FLEET_UPLOAD_CONCURRENCY = 4
+UPLOAD_BUFFER_CHUNKS = 4
+UPLOAD_RETRIES = 2
+UPLOAD_RETRY_DELAY = 5
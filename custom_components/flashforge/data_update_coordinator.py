@@ -1,22 +1,76 @@
 """DataUpdateCoordinator for flashforge integration."""
 
+import asyncio
 import logging
-from datetime import timedelta
+from collections.abc import AsyncIterable, Awaitable, Callable
+from dataclasses import replace
+from datetime import datetime, timedelta
+from functools import partial
+from time import monotonic
 from typing import Any
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from flashforge import FlashForgeClient, JobControl, TempControl
+from flashforge import (
+    FFGcodeFileEntry,
+    FFMachineInfo,
+    FlashForgeClient,
+    JobControl,
+    MachineState,
+    TempControl,
+)
 
-from .const import DEFAULT_NAME, DOMAIN, MAX_FAILED_UPDATES, SCAN_INTERVAL
+from .catalog import FileCatalog, file_name
+from .circuit_breaker import BreakerState, CircuitBreaker
+from .commands import CommandCoalescer, CommandPriority, CommandQueue
+from .connection import FlashForgeConnection
+from .const import (
+    BURST_POLL_COUNT,
+    DEFAULT_NAME,
+    DOMAIN,
+    OPTIMISTIC_CONFIRM_WINDOW,
+    PRINTER_HTTP_PORT,
+    PROBE_TIMEOUT,
+    SCAN_INTERVAL,
+    SCAN_INTERVAL_ACTIVE,
+    SCAN_INTERVAL_BURST,
+    SCAN_INTERVAL_IDLE,
+    UPDATE_TIMEOUT,
+)
+from .mjpeg import MjpegStreamHub
+from .models import FlashForgeData
+from .scheduler import async_get_fleet
+from .storage import FlashForgeStore
+from .thumbnail_cache import ThumbnailCache, ThumbnailKey
+from .upload import (
+    UploadProgress,
+    UploadTransferError,
+    UploadVerificationError,
+    async_post_file,
+    upload_headers,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Machine states that warrant the fast polling cadence, besides heating
+ACTIVE_STATES = frozenset(
+    {
+        MachineState.BUSY,
+        MachineState.CALIBRATING,
+        MachineState.PRINTING,
+        MachineState.PAUSING,
+    }
+)
 
-class FlashForgeDataUpdateCoordinator(DataUpdateCoordinator):
+
+class FlashForgeDataUpdateCoordinator(DataUpdateCoordinator[FlashForgeData]):
     """Class to manage fetching FlashForge printer data."""
 
     config_entry: ConfigEntry
@@ -34,54 +88,436 @@ class FlashForgeDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.config_entry = config_entry
         self.client = client  # Make client accessible to entities
-        self.data = {
-            "status": None,
-            "info": None,
-            "files": [],
-            "thumbnail": None,
-        }
-        self.failedupdates = 0
+        self.connection = FlashForgeConnection(hass, client)
+        self.stream_hub = MjpegStreamHub(hass, self.connection)
+        self.data = FlashForgeData()
+        self.fleet = async_get_fleet(hass)
+        # Offset of the first poll, so printers set up together poll apart
+        self._phase_offset = self.fleet.async_register()
+        # Polling cadence picked from the printer state, before jitter
+        self.cadence = SCAN_INTERVAL
+        self.breaker = CircuitBreaker()
+        self._burst_remaining = 0
+        # Cancels the poll that opens a burst, while one is pending
+        self._unsub_burst: Callable[[], None] | None = None
+        # Fields that changed in the last update, see FlashForgeEntity
+        self.changed_fields: frozenset[str] = frozenset()
+        # FFMachineInfo field -> (value a command is expected to set,
+        # confirmation deadline); shown by every entity reading the field
+        self.optimistic: dict[str, tuple[Any, float]] = {}
+        # Commands reach the printer one at a time, by priority
+        self.queue = CommandQueue()
+        # Slider commands, each confirmed by the following burst of polls
+        self.commands = CommandCoalescer(
+            hass, self.queue.async_execute, self.async_start_burst
+        )
+        self.thumbnails = ThumbnailCache()
+        self.catalog = FileCatalog()
+        # Narrows the files offered by the file select
+        self.file_filter = ""
+        self.store = FlashForgeStore(
+            hass,
+            config_entry.unique_id or config_entry.entry_id,
+            self.thumbnails,
+        )
 
-    async def async_update_data(self) -> dict[str, Any]:
+    async def async_update_data(self) -> FlashForgeData:
         """Update data via API."""
-        try:
-            info = await self.client.get_printer_status()
-            files = await self.client.files.get_local_file_list()
-
-            # Get thumbnail if currently printing
-            thumbnail = None
-            if info and info.print_file_name:
-                try:
-                    thumbnail_bytes = await self.client.files.get_gcode_thumbnail(
-                        info.print_file_name
-                    )
-                    if thumbnail_bytes:
-                        thumbnail = thumbnail_bytes
-                except Exception as e:  # noqa: BLE001
-                    _LOGGER.debug("Could not fetch thumbnail: %s", e)
-
-        except (TimeoutError, ConnectionError) as err:
-            self.failedupdates += 1
-            if self.failedupdates >= MAX_FAILED_UPDATES:
-                self.failedupdates = 0
-                raise UpdateFailed(err) from err
-            return self.data  # Return stale data on intermittent failure
-
-        if not files:
-            files = []
-
-        self.failedupdates = 0
-
-        return {
-            "status": info.machine_state.value if info else None,
-            "info": info,
-            "files": files,
-            "thumbnail": thumbnail,
+        if self.breaker.state is BreakerState.OPEN:
+            # Knock before paying the full timeouts of every poll request
+            self.breaker.half_open()
+            if not await self._async_probe():
+                return self._handle_failed_update(
+                    ConnectionError(f"{self.client.ip_address} is not reachable")
+                )
+            # The printer may have rebooted; log in again before polling
+            try:
+                await self.connection.async_connect(attempts=1)
+            except ConnectionError as err:
+                return self._handle_failed_update(err)
+
+        previous_key = ThumbnailKey.from_info(self.data.info)
+        deadline = self.hass.loop.time() + UPDATE_TIMEOUT
+
+        # Issue all requests at once; the thumbnail is speculatively looked up
+        # for the file that was printing on the previous poll. The file list
+        # is only fetched on its own slow cadence.
+        info, thumbnail, *catalog = await asyncio.gather(
+            self._async_fetch(self.client.get_printer_status(), deadline),
+            self._async_fetch(self.async_get_thumbnail(previous_key), deadline),
+            *(
+                [self._async_fetch_catalog(deadline)]
+                if self.catalog.refresh_due()
+                else []
+            ),
+            return_exceptions=True,
+        )
+
+        if isinstance(info, Exception):
+            # Transport and parse errors count against the breaker alike
+            if not isinstance(info, (TimeoutError, ConnectionError)):
+                _LOGGER.debug("Could not fetch status of %s: %r", self.name, info)
+            return self._handle_failed_update(info)
+        if isinstance(info, BaseException):
+            raise info
+        if info is None:
+            # The library returns None rather than raising when it cannot
+            # reach the printer
+            return self._handle_failed_update(
+                ConnectionError(f"{self.client.ip_address} did not report its status")
+            )
+
+        # Keep the stale file list when only the file list request failed
+        if catalog and isinstance(catalog[0], BaseException):
+            _LOGGER.debug("Could not fetch file list: %s", catalog[0])
+        elif catalog:
+            files, details = catalog[0]
+            self.catalog.async_sync(files)
+            self.catalog.async_update_details(details)
+
+        if (key := ThumbnailKey.from_info(info)) != previous_key:
+            # The speculative thumbnail belongs to another file
+            thumbnail = await self._async_fetch_remaining(
+                self.async_get_thumbnail(key), deadline
+            )
+        elif isinstance(thumbnail, BaseException):
+            _LOGGER.debug("Could not fetch thumbnail: %s", thumbnail)
+            thumbnail = self.data.thumbnail
+        if key is not None and key != previous_key:
+            self._track_print_file(key, thumbnail)
+
+        data = FlashForgeData.from_info(
+            info,
+            self.catalog.paths,
+            thumbnail,
+            has_filtration=self.client.filtration_control,
+        )
+        # Only a poll that produced a snapshot counts as a success
+        self.breaker.record_success()
+        self._schedule_next_update(data)
+        self.fleet.async_record_poll()
+        self.store.async_update(data.files)
+        # A reverted value may not show up in the changed fields
+        self.changed_fields = self._diff_fields(
+            self.data, data
+        ) | self._resolve_optimistic(info)
+        return data
+
+    @staticmethod
+    def _diff_fields(old: FlashForgeData, new: FlashForgeData) -> frozenset[str]:
+        """Return the FFMachineInfo fields and snapshot attributes that differ."""
+        changed = {
+            name
+            for name in FlashForgeData.__slots__
+            if name != "info" and getattr(old, name) != getattr(new, name)
         }
+        old_info = old.info
+        new_info = new.info
+        if old_info is None or new_info is None:
+            if old_info is not new_info:
+                changed.update(FFMachineInfo.model_fields)
+        else:
+            changed.update(
+                name
+                for name in FFMachineInfo.model_fields
+                if getattr(old_info, name) != getattr(new_info, name)
+            )
+        return frozenset(changed)
+
+    def _handle_failed_update(self, err: Exception) -> FlashForgeData:
+        """Count a failed status request and decide whether to give up."""
+        self.changed_fields = self._resolve_optimistic(self.data.info)
+        self.breaker.record_failure()
+        self._schedule_next_update(None)
+        if self.breaker.state is BreakerState.OPEN:
+            self.connection.async_mark_lost()
+            raise UpdateFailed(err) from err
+        return self.data  # Return stale data on intermittent failure
+
+    async def _async_probe(self) -> bool:
+        """Return True if the printer accepts a TCP connection."""
+        try:
+            async with asyncio.timeout(PROBE_TIMEOUT):
+                _, writer = await asyncio.open_connection(
+                    self.client.ip_address, PRINTER_HTTP_PORT
+                )
+        except (TimeoutError, OSError) as err:
+            _LOGGER.debug("Liveness probe of %s failed: %s", self.name, err)
+            return False
+        writer.close()
+        return True
+
+    async def _async_fetch(self, coro: Awaitable[Any], deadline: float) -> Any:
+        """Await a printer request, bounded by the deadline of the update cycle."""
+        async with asyncio.timeout_at(deadline), self.fleet.async_request():
+            return await coro
+
+    async def _async_fetch_catalog(
+        self, deadline: float
+    ) -> tuple[list[str], list[FFGcodeFileEntry]]:
+        """Fetch the file list, with the metadata of the recently printed files."""
+        files, details = await asyncio.gather(
+            self._async_fetch(self.client.files.get_local_file_list(), deadline),
+            self._async_fetch(self.client.files.get_recent_file_list(), deadline),
+            return_exceptions=True,
+        )
+        if isinstance(files, BaseException):
+            raise files
+        if isinstance(details, BaseException):
+            _LOGGER.debug("Could not fetch recent files: %s", details)
+            details = []
+        return files or [], details or []
+
+    @callback
+    def _track_print_file(self, key: ThumbnailKey, thumbnail: bytes | None) -> None:
+        """Record a newly printing file in the catalog."""
+        name = file_name(key.file_name)
+        if name not in self.catalog:
+            # Sent by a slicer since the last file list; fetch it sooner
+            self.catalog.async_invalidate()
+        self.catalog.async_mark_used(name)
+        self.catalog.async_set_thumbnail(name, present=thumbnail is not None)
+
+    async def _async_fetch_remaining(
+        self, coro: Awaitable[Any], deadline: float
+    ) -> Any:
+        """Await a follow-up request within what is left of the update cycle."""
+        try:
+            return await self._async_fetch(coro, deadline)
+        except TimeoutError:
+            _LOGGER.debug("Update cycle deadline reached for %s", self.name)
+            return None
+
+    async def async_get_thumbnail(self, key: ThumbnailKey | None) -> bytes | None:
+        """Return the thumbnail of a G-code file, fetching it only on a cache miss."""
+        if key is None:
+            return None
+        return await self.thumbnails.async_get_or_fetch(
+            key, partial(self._async_fetch_thumbnail, key.file_name)
+        )
+
+    async def _async_fetch_thumbnail(self, file_name: str) -> bytes | None:
+        """Fetch the thumbnail of a G-code file from the printer."""
+        try:
+            thumbnail_bytes = await self.client.files.get_gcode_thumbnail(file_name)
+        except Exception as e:  # noqa: BLE001
+            _LOGGER.debug("Could not fetch thumbnail: %s", e)
+            return None
+        return thumbnail_bytes or None
+
+    @callback
+    def _schedule_next_update(self, data: FlashForgeData | None) -> None:
+        """Pick the polling cadence for the next update from the printer state."""
+        if self._burst_remaining > 0:
+            self._burst_remaining -= 1
+            seconds = SCAN_INTERVAL_BURST
+        elif self.breaker.state is BreakerState.OPEN:
+            seconds = self.breaker.retry_delay
+        elif self.breaker.failures:
+            # Keep the current cadence while a failure may still be intermittent
+            return
+        elif data is not None and (
+            data.is_heating
+            or (data.info is not None and data.info.machine_state in ACTIVE_STATES)
+        ):
+            seconds = SCAN_INTERVAL_ACTIVE
+        else:
+            seconds = SCAN_INTERVAL_IDLE
+
+        if seconds != self.cadence:
+            _LOGGER.debug("Polling %s every %s seconds", self.name, seconds)
+            self.cadence = seconds
+        # Jitter every poll, and shift the first by this printer's phase
+        delay = seconds + self.fleet.jitter(seconds) + self._phase_offset * seconds
+        self._phase_offset = 0
+        self.update_interval = timedelta(seconds=delay)
+
+    @callback
+    def async_set_optimistic(self, **values: Any) -> None:
+        """Show the expected result of a command until a poll confirms it."""
+        deadline = monotonic() + OPTIMISTIC_CONFIRM_WINDOW
+        for field, value in values.items():
+            self.optimistic[field] = (value, deadline)
+        self.async_start_burst()
+        # Only the entities reading these fields write their state
+        self.changed_fields = frozenset(values)
+        self.async_update_listeners()
+
+    @callback
+    def _resolve_optimistic(self, info: FFMachineInfo | None) -> frozenset[str]:
+        """Drop expected values a poll confirmed or that expired unconfirmed."""
+        if not self.optimistic or info is None:
+            return frozenset()
+        now = monotonic()
+        resolved = frozenset(
+            field
+            for field, (value, deadline) in self.optimistic.items()
+            if getattr(info, field) == value or now >= deadline
+        )
+        for field in resolved:
+            del self.optimistic[field]
+        return resolved
+
+    @callback
+    def async_start_burst(self) -> None:
+        """Poll at the burst cadence for the next few updates after a command."""
+        self._burst_remaining = BURST_POLL_COUNT
+        self.cadence = SCAN_INTERVAL_BURST
+        self.update_interval = timedelta(seconds=SCAN_INTERVAL_BURST)
+        # Move a far-off idle poll forward instead of waiting for it; the
+        # polls after it follow the burst update interval
+        if self._unsub_burst is None:
+            self._unsub_burst = async_call_later(
+                self.hass, SCAN_INTERVAL_BURST, self._async_burst_poll
+            )
+
+    async def _async_burst_poll(self, _now: datetime) -> None:
+        """Open a burst, through the debouncer shared with refresh requests."""
+        self._unsub_burst = None
+        await self.async_request_refresh()
+
+    @property
+    def signal_file_filter(self) -> str:
+        """Return the dispatcher signal sent when the file filter changes."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_file_filter"
+
+    @callback
+    def async_set_file_filter(self, value: str) -> None:
+        """Narrow the files offered by the file select."""
+        self.file_filter = value
+        async_dispatcher_send(self.hass, self.signal_file_filter)
+
+    async def async_print_file(
+        self, name: str, *, leveling_before_print: bool = False
+    ) -> bool:
+        """Start printing a file stored on the printer."""
+        result = await self.async_send_command(
+            partial(
+                self.client.job_control.print_local_file,
+                file_name=name,
+                leveling_before_print=leveling_before_print,
+            )
+        )
+        self.catalog.async_mark_used(name)
+        # Poll at the burst cadence to pick up the result
+        self.async_start_burst()
+        return result
+
+    async def async_upload_file(
+        self,
+        name: str,
+        chunks: AsyncIterable[bytes],
+        size: int,
+        *,
+        start_print: bool = False,
+        leveling_before_print: bool = False,
+    ) -> None:
+        """Stream a file to the printer and check it shows up in the file list."""
+        progress = UploadProgress(self.hass, self.config_entry.entry_id, name, size)
+        try:
+            accepted = await async_post_file(
+                self.connection.session,
+                self.client,
+                name,
+                progress.async_track(chunks),
+                upload_headers(
+                    self.client,
+                    size,
+                    start_print=start_print,
+                    leveling_before_print=leveling_before_print,
+                ),
+            )
+        except (TimeoutError, aiohttp.ClientError, OSError) as err:
+            # An error status means the printer answered without taking the file
+            if progress.sent < size or isinstance(err, aiohttp.ClientResponseError):
+                msg = f"Upload of {name} to {self.config_entry.title} failed: {err}"
+                raise UploadTransferError(msg) from err
+            # The printer may have taken the file; sending it again could
+            # start a second print
+            msg = f"{self.config_entry.title} did not answer the upload of {name}"
+            raise HomeAssistantError(msg) from err
+        except ValueError as err:
+            msg = f"{self.config_entry.title} answered the upload of {name}: {err}"
+            raise HomeAssistantError(msg) from err
+        if not accepted:
+            msg = f"{self.config_entry.title} refused the upload of {name}"
+            raise HomeAssistantError(msg)
+
+        self.catalog.async_invalidate()
+        await self.async_refresh()
+        # A failed poll or file list request leaves the file list due
+        if not self.last_update_success or self.catalog.refresh_due():
+            msg = (
+                f"{self.config_entry.title} accepted {name}, but its file list "
+                "could not be fetched to verify the upload"
+            )
+            raise UploadVerificationError(msg)
+        if name not in self.catalog:
+            msg = f"{name} is missing from the files of {self.config_entry.title}"
+            raise UploadVerificationError(msg)
+        self.catalog.async_mark_used(name)
+        if start_print:
+            self.async_start_burst()
+
+    async def async_send_command(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        priority: CommandPriority = CommandPriority.NORMAL,
+    ) -> Any:
+        """Send a command to the printer through the command queue."""
+        return await self.queue.async_execute(func, *args, priority=priority)
+
+    async def async_send_optimistic(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        values: dict[str, Any],
+        *,
+        priority: CommandPriority = CommandPriority.NORMAL,
+    ) -> Any:
+        """
+        Send a command, showing its expected result while it waits to be sent.
+
+        The confirmation window restarts once the printer took the command. A
+        command that fails puts back the values shown before it.
+        """
+        previous = {field: self.optimistic.get(field) for field in values}
+        self.async_set_optimistic(**values)
+        try:
+            result = await self.async_send_command(func, priority=priority)
+        except BaseException:
+            for field, pending in previous.items():
+                if pending is None:
+                    self.optimistic.pop(field, None)
+                else:
+                    self.optimistic[field] = pending
+            self.changed_fields = frozenset(values)
+            self.async_update_listeners()
+            raise
+        deadline = monotonic() + OPTIMISTIC_CONFIRM_WINDOW
+        for field, value in values.items():
+            if field in self.optimistic:
+                self.optimistic[field] = (value, deadline)
+        return result
+
+    async def async_shutdown(self) -> None:
+        """Stop polling, drop unsent commands, leave the fleet and disconnect."""
+        self.commands.async_shutdown()
+        self.stream_hub.async_stop()
+        if self._unsub_burst is not None:
+            self._unsub_burst()
+            self._unsub_burst = None
+        self.fleet.async_unregister()
+        await super().async_shutdown()
+        await self.connection.async_close()
 
     async def async_config_entry_first_refresh(self) -> None:
         """Connect to printer and update with machine info."""
-        await self.client.initialize()
+        await self.connection.async_connect()
+        # Start warm with the thumbnails and file list persisted last run
+        await self.store.async_load()
+        self.catalog.async_sync(self.store.files, complete=False)
+        self.data = replace(self.data, files=self.catalog.paths)
         return await super().async_config_entry_first_refresh()
 
     @property
@@ -103,12 +539,12 @@ class FlashForgeDataUpdateCoordinator(DataUpdateCoordinator):
             serial_number=sn,
             hw_version=mac,
         )
+
     @property
     def job_control(self) -> JobControl:
         """Return job control instance."""
         return self.client.job_control
 
-
     @property
     def temp_control(self) -> TempControl:
         """Return temperature control instance."""
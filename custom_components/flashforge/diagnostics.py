@@ -0,0 +1,58 @@
+"""Diagnostics support for the FlashForge integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .data_update_coordinator import FlashForgeDataUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    thumbnails = coordinator.thumbnails
+    return {
+        "update_interval": coordinator.update_interval.total_seconds()
+        if coordinator.update_interval
+        else None,
+        "cadence": coordinator.cadence,
+        "circuit_breaker": {
+            "state": coordinator.breaker.state,
+            "failures": coordinator.breaker.failures,
+            "retry_delay": coordinator.breaker.retry_delay,
+        },
+        "connection": {
+            "connected": coordinator.connection.connected,
+            "connects": coordinator.connection.connects,
+        },
+        "camera_stream": {
+            "viewers": coordinator.stream_hub.viewers,
+            "connects": coordinator.stream_hub.connects,
+            "frames": coordinator.stream_hub.frames,
+            "dropped": coordinator.stream_hub.dropped,
+            "snapshot_hits": coordinator.stream_hub.snapshot_hits,
+            "snapshot_misses": coordinator.stream_hub.snapshot_misses,
+            "scaled": coordinator.stream_hub.scaled,
+        },
+        "command_queue": coordinator.queue.stats(),
+        "file_catalog": {
+            "files": len(coordinator.catalog),
+            "syncs": coordinator.catalog.syncs,
+            "version": coordinator.catalog.version,
+        },
+        "fleet": coordinator.fleet.stats(),
+        "thumbnail_cache": {
+            "entries": len(thumbnails),
+            "size": thumbnails.size,
+            "hits": thumbnails.hits,
+            "misses": thumbnails.misses,
+        },
+    }
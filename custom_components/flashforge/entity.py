@@ -0,0 +1,49 @@
+"""Base entity for the FlashForge integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .data_update_coordinator import FlashForgeDataUpdateCoordinator
+
+
+class FlashForgeEntity(CoordinatorEntity[FlashForgeDataUpdateCoordinator]):
+    """Coordinator entity that only writes state when its data changed."""
+
+    # FFMachineInfo fields or FlashForgeData attributes the state depends on.
+    # None writes the state on every coordinator update.
+    _update_fields: frozenset[str] | None = None
+
+    def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._written_available: bool | None = None
+
+    def _info_value(self, field: str) -> Any:
+        """Return an FFMachineInfo field, or the value a command is expected to set."""
+        if (pending := self.coordinator.optimistic.get(field)) is not None:
+            return pending[0]
+        if (info := self.coordinator.data.info) is None:
+            return None
+        return getattr(info, field)
+
+    @callback
+    def async_set_optimistic(self, **values: Any) -> None:
+        """Show the expected result of a command until a poll confirms it."""
+        self.coordinator.async_set_optimistic(**values)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        available = self.available
+        if (
+            self._update_fields is not None
+            and available == self._written_available
+            and self._update_fields.isdisjoint(self.coordinator.changed_fields)
+        ):
+            return
+        self._written_available = available
+        self.async_write_ha_state()
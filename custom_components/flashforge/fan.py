@@ -3,19 +3,21 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 from typing import TYPE_CHECKING
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .data_update_coordinator import FlashForgeDataUpdateCoordinator
+from .entity import FlashForgeEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .data_update_coordinator import FlashForgeDataUpdateCoordinator
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -45,13 +47,12 @@ async def async_setup_entry(
     async_add_entities(fans)
 
 
-class FlashForgeExternalFan(
-    CoordinatorEntity[FlashForgeDataUpdateCoordinator], FanEntity
-):
+class FlashForgeExternalFan(FlashForgeEntity, FanEntity):
     """External filtration fan entity."""
 
     _attr_has_entity_name = True
     _attr_supported_features = FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
+    _update_fields = frozenset({"external_fan_on"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize external fan."""
@@ -63,29 +64,29 @@ class FlashForgeExternalFan(
     @property
     def is_on(self) -> bool | None:
         """Return True if fan is on."""
-        info = self.coordinator.data.get("info")
-        if info is None:
-            return None
-        return info.external_fan_on
+        return self._info_value("external_fan_on")
 
     async def async_turn_on(self) -> None:
         """Turn on the fan."""
-        await self.coordinator.client.control.set_external_filtration_on()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_optimistic(
+            self.coordinator.client.control.set_external_filtration_on,
+            {"external_fan_on": True, "internal_fan_on": False},
+        )
 
     async def async_turn_off(self) -> None:
         """Turn off the fan."""
-        await self.coordinator.client.control.set_filtration_off()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_optimistic(
+            self.coordinator.client.control.set_filtration_off,
+            {"external_fan_on": False, "internal_fan_on": False},
+        )
 
 
-class FlashForgeInternalFan(
-    CoordinatorEntity[FlashForgeDataUpdateCoordinator], FanEntity
-):
+class FlashForgeInternalFan(FlashForgeEntity, FanEntity):
     """Internal filtration fan entity."""
 
     _attr_has_entity_name = True
     _attr_supported_features = FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
+    _update_fields = frozenset({"internal_fan_on"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize internal fan."""
@@ -97,29 +98,29 @@ class FlashForgeInternalFan(
     @property
     def is_on(self) -> bool | None:
         """Return True if fan is on."""
-        info = self.coordinator.data.get("info")
-        if info is None:
-            return None
-        return info.internal_fan_on
+        return self._info_value("internal_fan_on")
 
     async def async_turn_on(self) -> None:
         """Turn on the fan."""
-        await self.coordinator.client.control.set_internal_filtration_on()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_optimistic(
+            self.coordinator.client.control.set_internal_filtration_on,
+            {"internal_fan_on": True, "external_fan_on": False},
+        )
 
     async def async_turn_off(self) -> None:
         """Turn off the fan."""
-        await self.coordinator.client.control.set_filtration_off()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_optimistic(
+            self.coordinator.client.control.set_filtration_off,
+            {"external_fan_on": False, "internal_fan_on": False},
+        )
 
 
-class FlashForgeCoolingFan(
-    CoordinatorEntity[FlashForgeDataUpdateCoordinator], FanEntity
-):
+class FlashForgeCoolingFan(FlashForgeEntity, FanEntity):
     """Cooling fan entity with speed control."""
 
     _attr_has_entity_name = True
     _attr_supported_features = FanEntityFeature.SET_SPEED
+    _update_fields = frozenset({"cooling_fan_speed"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize cooling fan."""
@@ -131,10 +132,7 @@ class FlashForgeCoolingFan(
     @property
     def percentage(self) -> int | None:
         """Return the current speed percentage."""
-        info = self.coordinator.data.get("info")
-        if info is None:
-            return None
-        return info.cooling_fan_speed
+        return self._info_value("cooling_fan_speed")
 
     @property
     def is_on(self) -> bool | None:
@@ -143,13 +141,13 @@ class FlashForgeCoolingFan(
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
-        await self.coordinator.client.control.set_cooling_fan_speed(percentage)
-        await self.coordinator.async_request_refresh()
+        self.async_set_optimistic(cooling_fan_speed=percentage)
+        control = self.coordinator.client.control
+        await self.coordinator.commands.async_send(
+            "cooling_fan_speed", partial(control.set_cooling_fan_speed, percentage)
+        )
 
-    async def async_turn_on(
-        self,
-        percentage: int | None = None
-    ) -> None:
+    async def async_turn_on(self, percentage: int | None = None) -> None:
         """Turn on the fan."""
         speed = percentage if percentage is not None else 100
         await self.async_set_percentage(speed)
@@ -159,13 +157,12 @@ class FlashForgeCoolingFan(
         await self.async_set_percentage(0)
 
 
-class FlashForgeChamberFan(
-    CoordinatorEntity[FlashForgeDataUpdateCoordinator], FanEntity
-):
+class FlashForgeChamberFan(FlashForgeEntity, FanEntity):
     """Chamber fan entity with speed control."""
 
     _attr_has_entity_name = True
     _attr_supported_features = FanEntityFeature.SET_SPEED
+    _update_fields = frozenset({"chamber_fan_speed"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize chamber fan."""
@@ -177,10 +174,7 @@ class FlashForgeChamberFan(
     @property
     def percentage(self) -> int | None:
         """Return the current speed percentage."""
-        info = self.coordinator.data.get("info")
-        if info is None:
-            return None
-        return info.chamber_fan_speed
+        return self._info_value("chamber_fan_speed")
 
     @property
     def is_on(self) -> bool | None:
@@ -189,13 +183,13 @@ class FlashForgeChamberFan(
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
-        await self.coordinator.client.control.set_chamber_fan_speed(percentage)
-        await self.coordinator.async_request_refresh()
+        self.async_set_optimistic(chamber_fan_speed=percentage)
+        control = self.coordinator.client.control
+        await self.coordinator.commands.async_send(
+            "chamber_fan_speed", partial(control.set_chamber_fan_speed, percentage)
+        )
 
-    async def async_turn_on(
-        self,
-        percentage: int | None = None
-    ) -> None:
+    async def async_turn_on(self, percentage: int | None = None) -> None:
         """Turn on the fan."""
         speed = percentage if percentage is not None else 100
         await self.async_set_percentage(speed)
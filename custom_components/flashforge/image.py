@@ -6,9 +6,12 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.components.image import ImageEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .entity import FlashForgeEntity
+from .thumbnail_cache import ThumbnailKey
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -33,12 +36,11 @@ async def async_setup_entry(
     async_add_entities([FlashForgeThumbnailImage(coordinator)])
 
 
-class FlashForgeThumbnailImage(
-    CoordinatorEntity["FlashForgeDataUpdateCoordinator"], ImageEntity
-):
+class FlashForgeThumbnailImage(FlashForgeEntity, ImageEntity):
     """Print thumbnail image entity."""
 
     _attr_has_entity_name = True
+    _update_fields = frozenset({"print_file_name", "total_print_layers", "thumbnail"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize thumbnail image."""
@@ -52,18 +54,31 @@ class FlashForgeThumbnailImage(
         self._attr_device_info = coordinator.device_info
         self._attr_name = "Print Thumbnail"
         self._attr_content_type = "image/png"
+        self._thumbnail_key = ThumbnailKey.from_info(coordinator.data.info)
+        self._thumbnail = coordinator.data.thumbnail
+        self._attr_image_last_updated = dt_util.utcnow()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        key = ThumbnailKey.from_info(self.coordinator.data.info)
+        thumbnail = self.coordinator.data.thumbnail
+        # The thumbnail may arrive on a later poll than the file it belongs to
+        if key != self._thumbnail_key or thumbnail != self._thumbnail:
+            self._thumbnail_key = key
+            self._thumbnail = thumbnail
+            self._attr_image_last_updated = dt_util.utcnow()
+        super()._handle_coordinator_update()
 
     async def async_image(self) -> bytes | None:
         """Return bytes of image."""
-        thumbnail = self.coordinator.data.get("thumbnail")
-        if thumbnail:
-            return thumbnail
-        return None
+        # Served from the coordinator's thumbnail cache
+        return await self.coordinator.async_get_thumbnail(self._thumbnail_key)
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get("thumbnail") is not None
+            and self.coordinator.data.thumbnail is not None
         )
@@ -7,17 +7,17 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.light import LightEntity
 from homeassistant.components.light.const import ColorMode
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .commands import CommandPriority
 from .const import DOMAIN
-from .data_update_coordinator import FlashForgeDataUpdateCoordinator
+from .entity import FlashForgeEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from flashforge import FFMachineInfo
+    from .data_update_coordinator import FlashForgeDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,13 +33,12 @@ async def async_setup_entry(
     async_add_entities([FlashForgeLightEntity(coordinator)])
 
 
-class FlashForgeLightEntity(
-    CoordinatorEntity[FlashForgeDataUpdateCoordinator], LightEntity
-):
+class FlashForgeLightEntity(FlashForgeEntity, LightEntity):
     """An entity using CoordinatorEntity."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "light"
+    _update_fields = frozenset({"lights_on"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Pass coordinator to CoordinatorEntity."""
@@ -48,26 +47,26 @@ class FlashForgeLightEntity(
         self._attr_device_info = coordinator.device_info
         self._attr_name = "Light"
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_light"
-        info : FFMachineInfo | None = self.coordinator.data.get("info")
-        if info:
-            self._attr_is_on = info.lights_on
         self.supported_color_modes = {ColorMode.ONOFF}
         self.color_mode = ColorMode.ONOFF
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        info : FFMachineInfo | None = self.coordinator.data.get("info")
-        if info:
-            self._attr_is_on = info.lights_on
-        self.async_write_ha_state()
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if the light is on."""
+        return self._info_value("lights_on")
 
     async def async_turn_on(self) -> None:
         """Turn the light on."""
-        await self.coordinator.client.tcp_client.led_on()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_optimistic(
+            self.coordinator.client.tcp_client.led_on,
+            {"lights_on": True},
+            priority=CommandPriority.COSMETIC,
+        )
 
     async def async_turn_off(self) -> None:
         """Turn the light off."""
-        await self.coordinator.client.tcp_client.led_off()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_optimistic(
+            self.coordinator.client.tcp_client.led_off,
+            {"lights_on": False},
+            priority=CommandPriority.COSMETIC,
+        )
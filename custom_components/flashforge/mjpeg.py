@@ -0,0 +1,300 @@
+"""Incremental parser of MJPEG camera streams."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from contextlib import asynccontextmanager
+from functools import partial
+from time import monotonic
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.components.camera.img_util import (
+    JPEG_QUALITY,
+    TurboJPEGSingleton,
+    find_supported_scaling_factor,
+)
+from homeassistant.core import callback
+
+from .const import (
+    CAMERA_SCALE_WORKERS,
+    CAMERA_SNAPSHOT_TIMEOUT,
+    HTTP_TIMEOUT,
+    MJPEG_MAX_FRAME_SIZE,
+    MJPEG_VIEWER_QUEUE_SIZE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+
+    from .connection import FlashForgeConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+# JPEG Start-of-Image and End-of-Image markers
+SOI = b"\xff\xd8"
+EOI = b"\xff\xd9"
+
+_CONTENT_LENGTH = re.compile(rb"content-length:[ \t]*(\d+)", re.IGNORECASE)
+
+
+class MjpegParser:
+    """
+    Split an MJPEG stream into JPEG frames in time linear in its size.
+
+    Scanning resumes where the previous chunk left off, and consumed bytes are
+    dropped from the front of the buffer. A Content-Length header on the part
+    is trusted when the frame it delimits ends in an End-of-Image marker, so
+    markers inside embedded thumbnails do not cut a frame short.
+    """
+
+    def __init__(self, max_frame_size: int = MJPEG_MAX_FRAME_SIZE) -> None:
+        """Initialize an empty parser."""
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+        # Offset where scanning for the next marker resumes
+        self._pos = 0
+        # Offset of the Start-of-Image of the frame being read, if found
+        self._start = -1
+        # Content-Length of the part being read, if announced
+        self._length: int | None = None
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk of the stream and return the frames it completed."""
+        self._buffer += chunk
+        frames = []
+        while (frame := self._next_frame()) is not None:
+            frames.append(frame)
+        if len(self._buffer) > self.max_frame_size:
+            _LOGGER.debug("Dropping %s bytes without a frame", len(self._buffer))
+            self.reset()
+        return frames
+
+    def reset(self) -> None:
+        """Drop buffered data, e.g. after a gap in the stream."""
+        self._buffer.clear()
+        self._pos = 0
+        self._start = -1
+        self._length = None
+
+    def _next_frame(self) -> bytes | None:
+        """Return the next complete frame in the buffer, if any."""
+        buffer = self._buffer
+        if self._start < 0:
+            start = buffer.find(SOI, self._pos)
+            if start < 0:
+                # A marker may straddle the end of the chunk
+                self._pos = max(len(buffer) - 1, 0)
+                return None
+            # Part headers, if any, sit between the previous frame and this one
+            headers = _CONTENT_LENGTH.search(buffer, 0, start)
+            self._length = int(headers.group(1)) if headers else None
+            self._start = start
+            self._pos = start + len(SOI)
+
+        if self._length is not None:
+            end = self._start + self._length
+            if len(buffer) < end:
+                return None
+            if buffer[end - len(EOI) : end] != EOI:
+                # Announced length is off; fall back to scanning for the marker
+                self._length = None
+                return self._next_frame()
+        else:
+            eoi = buffer.find(EOI, self._pos)
+            if eoi < 0:
+                self._pos = max(len(buffer) - 1, self._pos)
+                return None
+            end = eoi + len(EOI)
+
+        with memoryview(buffer) as view:
+            frame = bytes(view[self._start : end])
+        del buffer[:end]
+        self._pos = 0
+        self._start = -1
+        self._length = None
+        return frame
+
+
+async def async_read_frame(stream: AsyncIterable[bytes]) -> bytes | None:
+    """Return the first JPEG frame of an MJPEG stream."""
+    parser = MjpegParser()
+    async for chunk in stream:
+        if frames := parser.feed(chunk):
+            return frames[0]
+    return None
+
+
+class MjpegStreamHub:
+    """
+    Share one upstream MJPEG connection between all viewers of a camera.
+
+    Frames are parsed once and handed to a bounded queue per viewer; a viewer
+    that falls behind loses its oldest frames rather than slowing the others.
+    The upstream connection opens with the first viewer and closes after the
+    last one leaves. The latest frame is kept to answer snapshots.
+    """
+
+    def __init__(self, hass: HomeAssistant, connection: FlashForgeConnection) -> None:
+        """Initialize a hub without viewers."""
+        self.hass = hass
+        self.connection = connection
+        self.connects = 0
+        self.frames = 0
+        self.dropped = 0
+        self.snapshot_hits = 0
+        self.snapshot_misses = 0
+        self.scaled = 0
+        self.latest_frame: bytes | None = None
+        self._latest_at = 0.0
+        self._snapshot_lock = asyncio.Lock()
+        # Downscaled copies of the latest frame, by scaling factor
+        self._scaled: dict[tuple[int, int], bytes] = {}
+        self._scale_slots = asyncio.Semaphore(CAMERA_SCALE_WORKERS)
+        self._viewers: set[asyncio.Queue[bytes | None]] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def viewers(self) -> int:
+        """Return the number of subscribed viewers."""
+        return len(self._viewers)
+
+    def _fresh_frame(self, max_age: float) -> bytes | None:
+        """Return the latest frame if it is at most max_age seconds old."""
+        if monotonic() - self._latest_at <= max_age:
+            return self.latest_frame
+        return None
+
+    async def async_get_frame(self, url: str, max_age: float) -> bytes | None:
+        """Return a recent frame, reading the camera only when none is fresh."""
+        if (frame := self._fresh_frame(max_age)) is not None:
+            self.snapshot_hits += 1
+            return frame
+        # Snapshots requested together share one read of the camera
+        async with self._snapshot_lock:
+            if (frame := self._fresh_frame(max_age)) is not None:
+                self.snapshot_hits += 1
+                return frame
+            self.snapshot_misses += 1
+            async with asyncio.timeout(CAMERA_SNAPSHOT_TIMEOUT):
+                if self._task is not None:
+                    # A stream is open; wait for its next frame
+                    async with self.async_subscribe(url) as frames:
+                        return await frames.get()
+                async with self.connection.session.get(url) as response:
+                    response.raise_for_status()
+                    frame = await async_read_frame(response.content.iter_any())
+            if frame is not None:
+                self._store(frame)
+            return frame
+
+    def _store(self, frame: bytes) -> None:
+        """Keep a frame as the latest one."""
+        self.latest_frame = frame
+        self._latest_at = monotonic()
+        self._scaled.clear()
+
+    async def async_scale(self, frame: bytes, width: int, height: int) -> bytes:
+        """
+        Return the frame reduced to at least the requested size.
+
+        TurboJPEG scales in the DCT domain by the smallest of its fixed factors
+        that keeps the requested size, so requests for nearby sizes share one
+        cached copy of the latest frame. Decoding runs in the executor, a few
+        frames at a time.
+        """
+        if not (turbo_jpeg := TurboJPEGSingleton.instance()):
+            return frame
+        try:
+            current_width, current_height, _, _ = turbo_jpeg.decode_header(frame)
+        except OSError:
+            return frame
+        factor = find_supported_scaling_factor(
+            current_width, current_height, width, height
+        )
+        if factor is None:
+            return frame
+        if frame is self.latest_frame and (scaled := self._scaled.get(factor)):
+            return scaled
+
+        async with self._scale_slots:
+            scaled = await self.hass.async_add_executor_job(
+                partial(
+                    turbo_jpeg.scale_with_quality,
+                    frame,
+                    scaling_factor=factor,
+                    quality=JPEG_QUALITY,
+                )
+            )
+        self.scaled += 1
+        if frame is self.latest_frame:
+            self._scaled[factor] = scaled
+        return scaled
+
+    @asynccontextmanager
+    async def async_subscribe(
+        self, url: str
+    ) -> AsyncIterator[asyncio.Queue[bytes | None]]:
+        """Yield a queue of frames, ending with None when the stream ends."""
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(MJPEG_VIEWER_QUEUE_SIZE)
+        self._viewers.add(queue)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_read(url), f"flashforge mjpeg {url}"
+            )
+        try:
+            yield queue
+        finally:
+            self._viewers.discard(queue)
+            if not self._viewers:
+                self.async_stop()
+
+    @callback
+    def async_stop(self) -> None:
+        """Close the upstream connection, ending the stream of every viewer."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            # The cancelled task no longer owns the hub, so it cannot tell them
+            for queue in self._viewers:
+                self._put(queue, None)
+
+    async def _async_read(self, url: str) -> None:
+        """Read the upstream stream and broadcast every frame."""
+        parser = MjpegParser()
+        self.connects += 1
+        try:
+            async with self.connection.session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=HTTP_TIMEOUT),
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_any():
+                    for frame in parser.feed(chunk):
+                        self._broadcast(frame)
+        except (TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.debug("Camera stream %s ended: %s", url, err)
+        finally:
+            # A hub restarted by a new viewer keeps its own task
+            if self._task is asyncio.current_task():
+                self._task = None
+                for queue in self._viewers:
+                    self._put(queue, None)
+
+    def _broadcast(self, frame: bytes) -> None:
+        """Hand a frame to every viewer."""
+        self.frames += 1
+        self._store(frame)
+        for queue in self._viewers:
+            self._put(queue, frame)
+
+    def _put(self, queue: asyncio.Queue[bytes | None], item: bytes | None) -> None:
+        """Queue an item, dropping the oldest frame of a slow viewer."""
+        if queue.full():
+            queue.get_nowait()
+            self.dropped += 1
+        queue.put_nowait(item)
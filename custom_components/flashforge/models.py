@@ -0,0 +1,52 @@
+"""Data models for the FlashForge integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from flashforge import MachineState
+
+if TYPE_CHECKING:
+    from flashforge import FFMachineInfo
+
+
+@dataclass(frozen=True, slots=True)
+class FlashForgeData:
+    """Snapshot of one printer poll, with derived values computed once."""
+
+    info: FFMachineInfo | None = None
+    files: tuple[str, ...] = ()
+    thumbnail: bytes | None = None
+    status: str | None = None
+    is_printing: bool = False
+    is_heating: bool = False
+    has_filtration: bool = False
+    progress: float | None = None
+
+    @classmethod
+    def from_info(
+        cls,
+        info: FFMachineInfo,
+        files: tuple[str, ...],
+        thumbnail: bytes | None,
+        *,
+        has_filtration: bool,
+    ) -> FlashForgeData:
+        """Build a snapshot from the machine info returned by the printer."""
+        return cls(
+            info=info,
+            files=files,
+            thumbnail=thumbnail,
+            status=info.machine_state.value,
+            is_printing=info.machine_state is MachineState.PRINTING,
+            # A heater can be warming up while the printer is otherwise idle
+            is_heating=info.machine_state is MachineState.HEATING
+            or any(
+                heater.set > heater.current
+                for heater in (info.print_bed, info.extruder)
+            ),
+            has_filtration=has_filtration,
+            # The printer reports progress as a fraction
+            progress=info.print_progress * 100.0,
+        )
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 from typing import TYPE_CHECKING
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.const import PERCENTAGE, UnitOfLength
+from homeassistant.core import callback
 
 from . import DOMAIN
+from .entity import FlashForgeEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -40,161 +43,145 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class FlashForgePrintSpeedNumber(NumberEntity):
-    """Representation of print speed override control."""
+class FlashForgeNumber(FlashForgeEntity, NumberEntity):
+    """Number entity that follows an FFMachineInfo field while printing."""
 
     _attr_has_entity_name = True
+    _attr_mode = NumberMode.SLIDER
+    # The FFMachineInfo field holding the current value
+    _info_field: str
+
+    def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
+        """Initialize the number entity."""
+        super().__init__(coordinator)
+        self._update_fields = frozenset({self._info_field})
+        self._attr_device_info = coordinator.device_info
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the reported value, or the last one set if not reported."""
+        value = self._info_value(self._info_field)
+        # An out of range value (e.g. a 0% speed) means it was not reported
+        if (
+            value is not None
+            and self.native_min_value <= value <= self.native_max_value
+        ):
+            return value
+        return self._attr_native_value
+
+    @callback
+    def _async_set_value(self, value: float) -> None:
+        """Show a value being sent until a poll confirms it."""
+        self._attr_native_value = value
+        self.async_set_optimistic(**{self._info_field: value})
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available and printer is printing."""
+        return (
+            self.coordinator.last_update_success and self.coordinator.data.is_printing
+        )
+
+
+class FlashForgePrintSpeedNumber(FlashForgeNumber):
+    """Representation of print speed override control."""
+
     _attr_native_min_value = 50
     _attr_native_max_value = 200
     _attr_native_step = 5
     _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_mode = NumberMode.SLIDER
     _attr_icon = "mdi:speedometer"
+    _info_field = "print_speed_adjust"
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the print speed number entity."""
-        self.coordinator = coordinator
+        self._attr_native_value = 100
+        super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_print_speed"
         self._attr_name = "Print Speed"
-        self._attr_device_info = coordinator.device_info
-        self._attr_native_value = 100
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new print speed value."""
-        try:
-            await self.coordinator.client.control.set_speed_override(int(value))
-            self._attr_native_value = value
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
-        except Exception:
-            _LOGGER.exception("Error setting print speed")
+        self._async_set_value(value)
+        control = self.coordinator.client.control
+        await self.coordinator.commands.async_send(
+            "print_speed", partial(control.set_speed_override, int(value))
+        )
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available and printer is printing."""
-        if not self.coordinator.last_update_success:
-            return False
-        info = self.coordinator.data.get("info")
-        if not info or not hasattr(info, "machine_state"):
-            return False
-        return str(info.machine_state).lower() == "printing"
 
-
-class FlashForgeZOffsetNumber(NumberEntity):
+class FlashForgeZOffsetNumber(FlashForgeNumber):
     """Representation of Z-axis offset override control."""
 
-    _attr_has_entity_name = True
     _attr_native_min_value = -2.0
     _attr_native_max_value = 2.0
     _attr_native_step = 0.05
     _attr_native_unit_of_measurement = UnitOfLength.MILLIMETERS
-    _attr_mode = NumberMode.SLIDER
     _attr_icon = "mdi:arrow-expand-vertical"
+    _info_field = "z_axis_compensation"
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the Z offset number entity."""
-        self.coordinator = coordinator
+        self._attr_native_value = 0.0
+        super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_z_offset"
         self._attr_name = "Z Axis Offset"
-        self._attr_device_info = coordinator.device_info
-        self._attr_native_value = 0.0
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new Z offset value."""
-        try:
-            await self.coordinator.client.control.set_z_axis_override(value)
-            self._attr_native_value = value
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
-        except Exception:
-            _LOGGER.exception("Error setting Z offset")
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available and printer is printing."""
-        if not self.coordinator.last_update_success:
-            return False
-        info = self.coordinator.data.get("info")
-        if not info or not hasattr(info, "machine_state"):
-            return False
-        return str(info.machine_state).lower() == "printing"
+        self._async_set_value(value)
+        control = self.coordinator.client.control
+        await self.coordinator.commands.async_send(
+            "z_offset", partial(control.set_z_axis_override, value)
+        )
 
 
-class FlashForgeChamberFanNumber(NumberEntity):
+class FlashForgeChamberFanNumber(FlashForgeNumber):
     """Representation of chamber fan speed control."""
 
-    _attr_has_entity_name = True
     _attr_native_min_value = 0
     _attr_native_max_value = 100
     _attr_native_step = 5
     _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_mode = NumberMode.SLIDER
     _attr_icon = "mdi:fan"
+    _info_field = "chamber_fan_speed"
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the chamber fan number entity."""
-        self.coordinator = coordinator
+        self._attr_native_value = 0
+        super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_chamber_fan_speed"
         self._attr_name = "Chamber Fan Speed"
-        self._attr_device_info = coordinator.device_info
-        self._attr_native_value = 0
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new chamber fan speed value."""
-        try:
-            await self.coordinator.client.control.set_chamber_fan_speed(int(value))
-            self._attr_native_value = value
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
-        except Exception:
-            _LOGGER.exception("Error setting chamber fan speed")
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available and printer is printing."""
-        if not self.coordinator.last_update_success:
-            return False
-        info = self.coordinator.data.get("info")
-        if not info or not hasattr(info, "machine_state"):
-            return False
-        return str(info.machine_state).lower() == "printing"
+        self._async_set_value(value)
+        control = self.coordinator.client.control
+        await self.coordinator.commands.async_send(
+            "chamber_fan_speed", partial(control.set_chamber_fan_speed, int(value))
+        )
 
 
-class FlashForgeCoolingFanNumber(NumberEntity):
+class FlashForgeCoolingFanNumber(FlashForgeNumber):
     """Representation of cooling fan speed control."""
 
-    _attr_has_entity_name = True
     _attr_native_min_value = 0
     _attr_native_max_value = 100
     _attr_native_step = 5
     _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_mode = NumberMode.SLIDER
     _attr_icon = "mdi:fan"
+    _info_field = "cooling_fan_speed"
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the cooling fan number entity."""
-        self.coordinator = coordinator
+        self._attr_native_value = 0
+        super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_cooling_fan_speed"
         self._attr_name = "Cooling Fan Speed"
-        self._attr_device_info = coordinator.device_info
-        self._attr_native_value = 0
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new cooling fan speed value."""
-        try:
-            await self.coordinator.client.control.set_cooling_fan_speed(int(value))
-            self._attr_native_value = value
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
-        except Exception:
-            _LOGGER.exception("Error setting cooling fan speed")
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available and printer is printing."""
-        if not self.coordinator.last_update_success:
-            return False
-        info = self.coordinator.data.get("info")
-        if not info or not hasattr(info, "machine_state"):
-            return False
-        return str(info.machine_state).lower() == "printing"
+        self._async_set_value(value)
+        control = self.coordinator.client.control
+        await self.coordinator.commands.async_send(
+            "cooling_fan_speed", partial(control.set_cooling_fan_speed, int(value))
+        )
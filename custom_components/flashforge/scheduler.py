@@ -0,0 +1,107 @@
+"""Fleet-wide poll scheduling for FlashForge printers."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import deque
+from contextlib import asynccontextmanager
+from itertools import count
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .const import (
+    DOMAIN,
+    FLEET_MAX_CONCURRENT_REQUESTS,
+    FLEET_POLL_JITTER,
+    FLEET_THROUGHPUT_WINDOW,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+
+# hass.data[DOMAIN] maps config entry ids to coordinators; the fleet is
+# shared by all of them
+DATA_FLEET = f"{DOMAIN}_fleet"
+
+# Fractional part of the golden ratio; successive multiples of it spread
+# evenly over [0, 1) however many printers there are
+_GOLDEN_RATIO = 0.6180339887498949
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> FleetScheduler:
+    """Return the fleet scheduler, creating it with the first printer."""
+    if (fleet := hass.data.get(DATA_FLEET)) is None:
+        fleet = hass.data[DATA_FLEET] = FleetScheduler()
+    return fleet
+
+
+class FleetScheduler:
+    """Spread the polls of all printers and cap their concurrent requests."""
+
+    def __init__(self, max_concurrent: int = FLEET_MAX_CONCURRENT_REQUESTS) -> None:
+        """Initialize the scheduler."""
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+        self.printers = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.polls = 0
+        self._slots = count()
+        self._recent_polls: deque[float] = deque()
+
+    @callback
+    def async_register(self) -> float:
+        """Register a printer and return its poll phase, a fraction of the interval."""
+        self.printers += 1
+        return (next(self._slots) * _GOLDEN_RATIO) % 1
+
+    @callback
+    def async_unregister(self) -> None:
+        """Unregister a printer."""
+        self.printers -= 1
+
+    @staticmethod
+    def jitter(seconds: float) -> float:
+        """Return a random offset that keeps printers from polling in lockstep."""
+        return random.uniform(-FLEET_POLL_JITTER, FLEET_POLL_JITTER) * seconds  # noqa: S311
+
+    @asynccontextmanager
+    async def async_request(self) -> AsyncIterator[None]:
+        """Wait for a free request slot and hold it while the request runs."""
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    @callback
+    def async_record_poll(self) -> None:
+        """Count a completed poll."""
+        now = monotonic()
+        self.polls += 1
+        self._recent_polls.append(now)
+        while self._recent_polls[0] < now - FLEET_THROUGHPUT_WINDOW:
+            self._recent_polls.popleft()
+
+    @property
+    def polls_per_minute(self) -> float:
+        """Return the fleet-wide poll throughput over the recent window."""
+        cutoff = monotonic() - FLEET_THROUGHPUT_WINDOW
+        recent = sum(timestamp >= cutoff for timestamp in self._recent_polls)
+        return recent * 60 / FLEET_THROUGHPUT_WINDOW
+
+    def stats(self) -> dict[str, Any]:
+        """Return the fleet metrics."""
+        return {
+            "printers": self.printers,
+            "in_flight": self.in_flight,
+            "max_concurrent": self.max_concurrent,
+            "polls": self.polls,
+            "polls_per_minute": round(self.polls_per_minute, 1),
+        }
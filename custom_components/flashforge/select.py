@@ -7,9 +7,10 @@ from typing import TYPE_CHECKING, ClassVar
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
+from .const import DOMAIN, FILE_SELECT_WINDOW
+from .entity import FlashForgeEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -39,13 +40,14 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class FlashForgeFileSelect(
-    CoordinatorEntity["FlashForgeDataUpdateCoordinator"], SelectEntity
-):
+class FlashForgeFileSelect(FlashForgeEntity, SelectEntity):
     """Representation of file selection entity."""
 
     _attr_has_entity_name = True
     _attr_should_poll = False
+    # The options follow the catalog revision; only availability follows
+    # the printer
+    _update_fields = frozenset()
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the file select entity."""
@@ -55,40 +57,70 @@ class FlashForgeFileSelect(
         self._attr_icon = "mdi:file-cad"
         self._attr_name = "File List"
         self._attr_device_info = coordinator.device_info
-
-        # Initialize with files from coordinator
-        files = coordinator.data.get("files", [])
-        self._attr_options = self._clean_file_list(files) if files else ["No files"]
-        self._attr_current_option = (
-            self._attr_options[0] if self._attr_options else None
+        self._attr_current_option = None
+        self._attr_options = self._file_window()
+        self._attr_current_option = self._attr_options[0]
+        self._catalog_revision = coordinator.catalog.revision
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the file filter."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.coordinator.signal_file_filter,
+                self._handle_file_filter,
+            )
         )
 
-    def _clean_file_list(self, files: list[str]) -> list[str]:
-        """Clean file names by removing /data/ prefix."""
-        cleaned = []
-        for file in files:
-            if isinstance(file, str):
-                cleaned.append(file.removeprefix("/data/"))
-            else:
-                cleaned.append(str(file))
-        return cleaned if cleaned else ["No files"]
+    def _file_window(self) -> list[str]:
+        """
+        Return a bounded window of files matching the filter, recent first.
+
+        The window keeps the state size constant however many files the
+        printer holds; the selected file stays in it so the state is valid.
+        """
+        catalog = self.coordinator.catalog
+        options = [
+            entry.name
+            for entry in catalog.search(
+                self.coordinator.file_filter, FILE_SELECT_WINDOW
+            )
+        ]
+        current = self._attr_current_option
+        if current in catalog and current not in options:
+            options.append(current)
+        return options or ["No files"]
+
+    @callback
+    def _update_options(self) -> None:
+        """Rebuild the options, keeping the selection while it is still valid."""
+        self._attr_options = self._file_window()
+        if self._attr_current_option not in self._attr_options:
+            self._attr_current_option = self._attr_options[0]
+
+    @callback
+    def _handle_file_filter(self) -> None:
+        """Narrow the options to the new file filter."""
+        # A selection the filter excludes is dropped rather than kept
+        if self._attr_current_option not in {
+            entry.name
+            for entry in self.coordinator.catalog.search(self.coordinator.file_filter)
+        }:
+            self._attr_current_option = None
+        self._update_options()
+        self.async_write_ha_state()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        files = self.coordinator.data.get("files", [])
-        cleaned_files = self._clean_file_list(files) if files else ["No files"]
-
-        # Only update if files have changed
-        if cleaned_files != self._attr_options:
-            self._attr_options = cleaned_files
-            # Keep current selection if still valid, otherwise select first
-            if self._attr_current_option not in self._attr_options:
-                self._attr_current_option = (
-                    self._attr_options[0] if self._attr_options else None
-                )
+        # Only rebuild the options if files were added, removed or used
+        if (revision := self.coordinator.catalog.revision) != self._catalog_revision:
+            self._catalog_revision = revision
+            self._update_options()
+            self.async_write_ha_state()
 
-        self.async_write_ha_state()
+        super()._handle_coordinator_update()
 
     async def async_select_option(self, option: str) -> None:
         """Update the current selected option."""
@@ -100,15 +132,15 @@ class FlashForgeFileSelect(
             _LOGGER.warning("Attempted to select invalid option: %s", option)
 
 
-class FlashForgeFiltrationSelect(
-    CoordinatorEntity["FlashForgeDataUpdateCoordinator"], SelectEntity
-):
+class FlashForgeFiltrationSelect(FlashForgeEntity, SelectEntity):
     """Representation of filtration mode selector."""
 
     _attr_has_entity_name = True
     _attr_should_poll = False
     _attr_options: ClassVar[list[str]] = ["Off", "Internal", "External"]
     _attr_icon = "mdi:air-filter"
+    # The selected mode is set locally; only availability follows the printer
+    _update_fields = frozenset()
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the filtration select entity."""
@@ -123,18 +155,24 @@ class FlashForgeFiltrationSelect(
         """Change the selected filtration mode."""
         try:
             if option == "Off":
-                await self.coordinator.client.control.set_filtration_off()
+                await self.coordinator.async_send_command(
+                    self.coordinator.client.control.set_filtration_off
+                )
             elif option == "Internal":
-                await self.coordinator.client.control.set_internal_filtration_on()
+                await self.coordinator.async_send_command(
+                    self.coordinator.client.control.set_internal_filtration_on
+                )
             elif option == "External":
-                await self.coordinator.client.control.set_external_filtration_on()
+                await self.coordinator.async_send_command(
+                    self.coordinator.client.control.set_external_filtration_on
+                )
             else:
                 _LOGGER.warning("Invalid filtration option: %s", option)
                 return
 
             self._attr_current_option = option
             self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_start_burst()
             _LOGGER.debug("Filtration mode set to: %s", option)
         except Exception:
             _LOGGER.exception("Error setting filtration mode to %s", option)
@@ -144,10 +182,5 @@ class FlashForgeFiltrationSelect(
         """Return True if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.client.filtration_control
+            and self.coordinator.data.has_filtration
         )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
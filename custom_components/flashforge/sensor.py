@@ -21,9 +21,9 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import FlashForgeEntity
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -35,6 +35,7 @@ if TYPE_CHECKING:
     from flashforge.models import FFMachineInfo
 
     from .data_update_coordinator import FlashForgeDataUpdateCoordinator
+    from .models import FlashForgeData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,7 +45,10 @@ class FlashforgeSensorEntityDescription(SensorEntityDescription):
     """Sensor entity description with added value fnc."""
 
     value_fnc: Callable[[FFMachineInfo], str | int | float | None] | None = None
+    # Reads a value the snapshot already derived, instead of value_fnc
+    snapshot_fnc: Callable[[FlashForgeData], str | int | float | None] | None = None
     exists_fn: Callable[[FFMachineInfo], bool] = lambda _: True
+    update_fields: frozenset[str] | None = None
 
 
 SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
@@ -53,7 +57,8 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         key="status",
         translation_key="status",
         icon="mdi:printer-3d",
-        value_fnc=lambda info: info.machine_state.value,
+        update_fields=frozenset({"machine_state"}),
+        snapshot_fnc=lambda data: data.status,
     ),
     FlashforgeSensorEntityDescription(
         key="job_percentage",
@@ -61,14 +66,15 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         icon="mdi:file-percent",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        # Use print_progress (float 0.0-1.0)
-        value_fnc=lambda info: info.print_progress * 100.0,
+        update_fields=frozenset({"print_progress"}),
+        snapshot_fnc=lambda data: data.progress,
     ),
     FlashforgeSensorEntityDescription(
         key="file",
         translation_key="file",
         icon="mdi:file-cad",
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_fields=frozenset({"print_file_name"}),
         value_fnc=lambda info: info.print_file_name,
     ),
     FlashforgeSensorEntityDescription(
@@ -76,6 +82,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         translation_key="current_layer",
         icon="mdi:layers-edit",
         state_class=SensorStateClass.MEASUREMENT,
+        update_fields=frozenset({"current_print_layer"}),
         value_fnc=lambda info: info.current_print_layer,
     ),
     FlashforgeSensorEntityDescription(
@@ -83,6 +90,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         translation_key="total_layers",
         icon="mdi:layers-triple",
         state_class=SensorStateClass.MEASUREMENT,
+        update_fields=frozenset({"total_print_layers"}),
         value_fnc=lambda info: info.total_print_layers,
     ),
     FlashforgeSensorEntityDescription(
@@ -91,12 +99,14 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         icon="mdi:timer-sand",
         native_unit_of_measurement=UnitOfTime.SECONDS,
         device_class=SensorDeviceClass.DURATION,
+        update_fields=frozenset({"estimated_time"}),
         value_fnc=lambda info: info.estimated_time,
     ),
     FlashforgeSensorEntityDescription(
         key="print_eta",
         translation_key="print_eta",
         icon="mdi:clock-outline",
+        update_fields=frozenset({"print_eta"}),
         value_fnc=lambda info: info.print_eta,
     ),
     FlashforgeSensorEntityDescription(
@@ -105,6 +115,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         icon="mdi:timer",
         native_unit_of_measurement=UnitOfTime.SECONDS,
         device_class=SensorDeviceClass.DURATION,
+        update_fields=frozenset({"print_duration"}),
         value_fnc=lambda info: info.print_duration,
     ),
     # TEMPERATURE SENSORS
@@ -115,6 +126,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
+        update_fields=frozenset({"print_bed"}),
         value_fnc=lambda info: info.print_bed.current if info.print_bed else None,
         exists_fn=lambda info: info.print_bed is not None,
     ),
@@ -125,6 +137,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
+        update_fields=frozenset({"print_bed"}),
         value_fnc=lambda info: info.print_bed.set if info.print_bed else None,
         exists_fn=lambda info: info.print_bed is not None,
     ),
@@ -135,6 +148,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
+        update_fields=frozenset({"extruder"}),
         value_fnc=lambda info: info.extruder.current if info.extruder else None,
         exists_fn=lambda info: info.extruder is not None,
     ),
@@ -145,6 +159,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
+        update_fields=frozenset({"extruder"}),
         value_fnc=lambda info: info.extruder.set if info.extruder else None,
         exists_fn=lambda info: info.extruder is not None,
     ),
@@ -157,6 +172,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_fields=frozenset({"cumulative_print_time"}),
         value_fnc=lambda info: info.cumulative_print_time,
     ),
     FlashforgeSensorEntityDescription(
@@ -167,6 +183,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_fields=frozenset({"cumulative_filament"}),
         value_fnc=lambda info: info.cumulative_filament,
     ),
     FlashforgeSensorEntityDescription(
@@ -177,6 +194,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DATA_SIZE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_fields=frozenset({"free_disk_space"}),
         value_fnc=lambda info: float(info.free_disk_space),
     ),
     FlashforgeSensorEntityDescription(
@@ -184,6 +202,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         translation_key="firmware_version",
         icon="mdi:chip",
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_fields=frozenset({"firmware_version"}),
         value_fnc=lambda info: info.firmware_version,
     ),
     FlashforgeSensorEntityDescription(
@@ -191,6 +210,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         translation_key="error_code",
         icon="mdi:alert-octagon",
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_fields=frozenset({"error_code"}),
         value_fnc=lambda info: info.error_code,
         exists_fn=lambda info: info.error_code is not None and info.error_code != "",
     ),
@@ -202,6 +222,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_fields=frozenset({"tvoc"}),
         value_fnc=lambda info: info.tvoc,
         exists_fn=lambda info: info.tvoc is not None,
     ),
@@ -212,6 +233,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfLength.MILLIMETERS,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_fields=frozenset({"z_axis_compensation"}),
         value_fnc=lambda info: info.z_axis_compensation,
         exists_fn=lambda info: info.z_axis_compensation is not None,
     ),
@@ -220,6 +242,7 @@ SENSORS: tuple[FlashforgeSensorEntityDescription, ...] = (
         translation_key="mac_address",
         icon="mdi:network-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_fields=frozenset({"mac_address"}),
         value_fnc=lambda info: info.mac_address,
     ),
 )
@@ -237,7 +260,7 @@ async def async_setup_entry(
     ]
 
     # Pre-check info to filter entities that don't exist (e.g., TVOC on some models)
-    info = coordinator.data.get("info")
+    info = coordinator.data.info
     entities = [
         FlashForgeSensor(coordinator=coordinator, description=description)
         for description in SENSORS
@@ -249,7 +272,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class FlashForgeSensor(CoordinatorEntity, SensorEntity):
+class FlashForgeSensor(FlashForgeEntity, SensorEntity):
     """Representation of a FlashForge sensor."""
 
     coordinator: FlashForgeDataUpdateCoordinator
@@ -265,6 +288,7 @@ class FlashForgeSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._attr_device_info = coordinator.device_info
         self.entity_description = description
+        self._update_fields = description.update_fields
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_{description.key}"
 
         # Note: self._attr_name is automatically set by _attr_has_entity_name = True
@@ -275,10 +299,13 @@ class FlashForgeSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> str | int | float | None:
         """Return sensor state."""
+        if self.entity_description.snapshot_fnc is not None:
+            return self.entity_description.snapshot_fnc(self.coordinator.data)
+
         if self.entity_description.value_fnc is None:
             return None
 
-        info = self.coordinator.data.get("info")
+        info = self.coordinator.data.info
 
         # Check if FFMachineInfo object exists before calling the value function
         if info is None:
@@ -0,0 +1,144 @@
+"""Services for FlashForge printers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_config_entry_ids
+
+from .catalog import file_name
+from .const import (
+    ATTR_FILE_NAME,
+    ATTR_FILE_PATH,
+    ATTR_LEVELING_BEFORE_PRINT,
+    ATTR_START_PRINT,
+    DOMAIN,
+    SERVICE_PRINT_FILE,
+    SERVICE_UPLOAD_FILE,
+)
+from .upload import async_upload_to_fleet
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .data_update_coordinator import FlashForgeDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+PRINT_FILE_SCHEMA = vol.Schema(
+    {
+        **cv.TARGET_SERVICE_FIELDS,
+        vol.Required(ATTR_FILE_NAME): cv.string,
+        vol.Optional(ATTR_LEVELING_BEFORE_PRINT, default=False): cv.boolean,
+    }
+)
+
+UPLOAD_FILE_SCHEMA = vol.Schema(
+    {
+        **cv.TARGET_SERVICE_FIELDS,
+        vol.Required(ATTR_FILE_PATH): cv.string,
+        vol.Optional(ATTR_START_PRINT, default=False): cv.boolean,
+        vol.Optional(ATTR_LEVELING_BEFORE_PRINT, default=False): cv.boolean,
+    }
+)
+
+
+async def _async_get_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[FlashForgeDataUpdateCoordinator]:
+    """Return the coordinators of the printers a service call targets."""
+    coordinators: dict[str, FlashForgeDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    entry_ids = await async_extract_config_entry_ids(call)
+    targets = [coordinators[entry_id] for entry_id in entry_ids & coordinators.keys()]
+    if not targets:
+        msg = "No loaded FlashForge printer is targeted"
+        raise ServiceValidationError(msg)
+    return targets
+
+
+async def _async_print_file(call: ServiceCall) -> None:
+    """Start printing a stored file on every targeted printer."""
+    coordinators = await _async_get_coordinators(call.hass, call)
+    name = file_name(call.data[ATTR_FILE_NAME])
+    # Check every printer first so a typo starts no print anywhere
+    if missing := [
+        coordinator.config_entry.title
+        for coordinator in coordinators
+        if name not in coordinator.catalog
+    ]:
+        msg = f"{name} is not on {', '.join(missing)}"
+        raise ServiceValidationError(msg)
+
+    results = await asyncio.gather(
+        *(
+            coordinator.async_print_file(
+                name, leveling_before_print=call.data[ATTR_LEVELING_BEFORE_PRINT]
+            )
+            for coordinator in coordinators
+        ),
+        return_exceptions=True,
+    )
+    failed = []
+    for coordinator, result in zip(coordinators, results, strict=True):
+        if isinstance(result, BaseException) or not result:
+            _LOGGER.warning(
+                "%s did not start %s: %s", coordinator.config_entry.title, name, result
+            )
+            failed.append(coordinator.config_entry.title)
+    if failed:
+        msg = f"Printing {name} failed on {', '.join(failed)}"
+        raise HomeAssistantError(msg)
+
+
+async def _async_upload_file(call: ServiceCall) -> ServiceResponse:
+    """Stream a local file to every targeted printer."""
+    hass = call.hass
+    coordinators = await _async_get_coordinators(hass, call)
+    path = Path(call.data[ATTR_FILE_PATH])
+    if not hass.config.is_allowed_path(str(path)):
+        msg = f"{path} is not in an allowed directory"
+        raise ServiceValidationError(msg)
+    try:
+        size = (await hass.async_add_executor_job(path.stat)).st_size
+    except OSError as err:
+        msg = f"Cannot read {path}: {err}"
+        raise ServiceValidationError(msg) from err
+
+    results = await async_upload_to_fleet(
+        coordinators,
+        path,
+        size,
+        start_print=call.data[ATTR_START_PRINT],
+        leveling_before_print=call.data[ATTR_LEVELING_BEFORE_PRINT],
+    )
+    if call.return_response:
+        return {"printers": {key: asdict(result) for key, result in results.items()}}
+    if failed := [result for result in results.values() if not result.success]:
+        msg = f"Upload of {path.name} failed on " + ", ".join(
+            f"{result.name} ({result.error})" for result in failed
+        )
+        raise HomeAssistantError(msg)
+    return None
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the FlashForge services."""
+    hass.services.async_register(
+        DOMAIN, SERVICE_PRINT_FILE, _async_print_file, schema=PRINT_FILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UPLOAD_FILE,
+        _async_upload_file,
+        schema=UPLOAD_FILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,88 @@
+"""Persistent storage of FlashForge thumbnails and file metadata."""
+
+from __future__ import annotations
+
+import binascii
+import logging
+from base64 import b64decode, b64encode
+from time import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_MAX_AGE, STORAGE_SAVE_DELAY, STORAGE_VERSION
+from .thumbnail_cache import ThumbnailCache, ThumbnailKey
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FlashForgeStore:
+    """Keep the thumbnails and file list of one printer across restarts."""
+
+    def __init__(
+        self, hass: HomeAssistant, serial: str, thumbnails: ThumbnailCache
+    ) -> None:
+        """Initialize the store for the printer with the given serial."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{serial}", private=True
+        )
+        self._thumbnails = thumbnails
+        # When each thumbnail was first stored, for expiry
+        self._added: dict[ThumbnailKey, float] = {}
+        self._saved_version = thumbnails.version
+        self.files: tuple[str, ...] = ()
+
+    async def async_load(self) -> None:
+        """Load persisted data into the thumbnail cache."""
+        data = await self._store.async_load() or {}
+        now = time()
+        for entry in data.get("thumbnails", []):
+            if now - entry["added"] > STORAGE_MAX_AGE:
+                continue
+            key = ThumbnailKey(entry["file_name"], entry["total_layers"])
+            try:
+                self._thumbnails.put(key, b64decode(entry["image"]))
+            except binascii.Error:
+                _LOGGER.debug("Dropping corrupt stored thumbnail of %s", key.file_name)
+                continue
+            self._added[key] = entry["added"]
+        self.files = tuple(data.get("files", ()))
+        self._saved_version = self._thumbnails.version
+
+    @callback
+    def async_update(self, files: tuple[str, ...]) -> None:
+        """Schedule a background write if the file list or thumbnails changed."""
+        if files == self.files and self._thumbnails.version == self._saved_version:
+            return
+        self.files = files
+        self._saved_version = self._thumbnails.version
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the persisted data."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist; the cache budget bounds its size."""
+        now = time()
+        added = {}
+        thumbnails = []
+        for key, image in self._thumbnails.items():
+            added[key] = self._added.get(key, now)
+            if now - added[key] > STORAGE_MAX_AGE:
+                continue
+            thumbnails.append(
+                {
+                    "file_name": key.file_name,
+                    "total_layers": key.total_layers,
+                    "added": added[key],
+                    "image": b64encode(image).decode(),
+                }
+            )
+        self._added = added
+        return {"files": list(self.files), "thumbnails": thumbnails}
@@ -6,9 +6,10 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import callback
 
 from . import DOMAIN
+from .commands import CommandPriority
+from .entity import FlashForgeEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -46,37 +47,44 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class FlashForgeLEDSwitch(SwitchEntity):
+class FlashForgeLEDSwitch(FlashForgeEntity, SwitchEntity):
     """Representation of LED light switch."""
 
     _attr_has_entity_name = True
     _attr_icon = "mdi:lightbulb"
+    _update_fields = frozenset({"lights_on"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the LED switch."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_led_switch"
         self._attr_name = "LED Lights"
         self._attr_device_info = coordinator.device_info
-        self._attr_is_on = False
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if the LED lights are on."""
+        return self._info_value("lights_on")
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn on LED lights."""
         try:
-            await self.coordinator.client.control.set_led_on()
-            self._attr_is_on = True
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_optimistic(
+                self.coordinator.client.control.set_led_on,
+                {"lights_on": True},
+                priority=CommandPriority.COSMETIC,
+            )
         except Exception:
             _LOGGER.exception("Error turning on LED lights")
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn off LED lights."""
         try:
-            await self.coordinator.client.control.set_led_off()
-            self._attr_is_on = False
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_optimistic(
+                self.coordinator.client.control.set_led_off,
+                {"lights_on": False},
+                priority=CommandPriority.COSMETIC,
+            )
         except Exception:
             _LOGGER.exception("Error turning off LED lights")
 
@@ -87,22 +95,18 @@ class FlashForgeLEDSwitch(SwitchEntity):
             self.coordinator.last_update_success and self.coordinator.client.led_control
         )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        # Update state from coordinator if available
-        self.async_write_ha_state()
-
 
-class FlashForgeCameraSwitch(SwitchEntity):
+class FlashForgeCameraSwitch(FlashForgeEntity, SwitchEntity):
     """Representation of camera on/off switch for Pro models."""
 
     _attr_has_entity_name = True
     _attr_icon = "mdi:camera"
+    # The printer does not report this state; it is set locally
+    _update_fields = frozenset()
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the camera switch."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_camera_switch"
         self._attr_name = "Camera"
         self._attr_device_info = coordinator.device_info
@@ -111,20 +115,24 @@ class FlashForgeCameraSwitch(SwitchEntity):
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn on camera."""
         try:
-            await self.coordinator.client.control.turn_camera_on()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.control.turn_camera_on,
+                priority=CommandPriority.COSMETIC,
+            )
             self._attr_is_on = True
             self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
         except Exception:
             _LOGGER.exception("Error turning on camera")
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn off camera."""
         try:
-            await self.coordinator.client.control.turn_camera_off()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.control.turn_camera_off,
+                priority=CommandPriority.COSMETIC,
+            )
             self._attr_is_on = False
             self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
         except Exception:
             _LOGGER.exception("Error turning off camera")
 
@@ -133,21 +141,17 @@ class FlashForgeCameraSwitch(SwitchEntity):
         """Return True if entity is available."""
         return self.coordinator.last_update_success and self.coordinator.client.is_pro
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
 
-
-class FlashForgeRunoutSensorSwitch(SwitchEntity):
+class FlashForgeRunoutSensorSwitch(FlashForgeEntity, SwitchEntity):
     """Representation of filament runout sensor switch."""
 
     _attr_has_entity_name = True
     _attr_icon = "mdi:printer-3d-nozzle-alert"
+    _update_fields = frozenset()
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the runout sensor switch."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_unique_id = (
             f"{coordinator.config_entry.unique_id}_runout_sensor_switch"
         )
@@ -158,20 +162,22 @@ class FlashForgeRunoutSensorSwitch(SwitchEntity):
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn on runout sensor."""
         try:
-            await self.coordinator.client.control.turn_runout_sensor_on()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.control.turn_runout_sensor_on
+            )
             self._attr_is_on = True
             self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
         except Exception:
             _LOGGER.exception("Error turning on runout sensor")
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn off runout sensor."""
         try:
-            await self.coordinator.client.control.turn_runout_sensor_off()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.control.turn_runout_sensor_off
+            )
             self._attr_is_on = False
             self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
         except Exception:
             _LOGGER.exception("Error turning off runout sensor")
 
@@ -180,46 +186,52 @@ class FlashForgeRunoutSensorSwitch(SwitchEntity):
         """Return True if entity is available."""
         return self.coordinator.last_update_success
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
-class FlashForgeFiltrationSwitch(SwitchEntity):
+class FlashForgeFiltrationSwitch(FlashForgeEntity, SwitchEntity):
     """Representation of filtration system switch."""
 
     _attr_has_entity_name = True
     _attr_icon = "mdi:air-filter"
+    _update_fields = frozenset({"external_fan_on", "internal_fan_on"})
 
     def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
         """Initialize the filtration switch."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.unique_id}_filtration_switch"
         self._attr_name = "Filtration System"
         self._attr_device_info = coordinator.device_info
-        self._attr_is_on = False
-        self._filtration_mode = "off"  # off, internal, external
+
+    @property
+    def _filtration_mode(self) -> str:
+        """Return off, internal or external from the fan states."""
+        if self._info_value("external_fan_on"):
+            return "external"
+        if self._info_value("internal_fan_on"):
+            return "internal"
+        return "off"
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if filtration is on."""
+        return self._filtration_mode != "off"
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn on filtration (defaults to external)."""
         try:
-            await self.coordinator.client.control.set_external_filtration_on()
-            self._attr_is_on = True
-            self._filtration_mode = "external"
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_optimistic(
+                self.coordinator.client.control.set_external_filtration_on,
+                {"external_fan_on": True, "internal_fan_on": False},
+            )
         except Exception:
             _LOGGER.exception("Error turning on filtration")
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn off filtration."""
         try:
-            await self.coordinator.client.control.set_filtration_off()
-            self._attr_is_on = False
-            self._filtration_mode = "off"
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_optimistic(
+                self.coordinator.client.control.set_filtration_off,
+                {"external_fan_on": False, "internal_fan_on": False},
+            )
         except Exception:
             _LOGGER.exception("Error turning off filtration")
 
@@ -228,7 +240,7 @@ class FlashForgeFiltrationSwitch(SwitchEntity):
         """Return True if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.client.filtration_control
+            and self.coordinator.data.has_filtration
         )
 
     @property
@@ -237,8 +249,3 @@ class FlashForgeFiltrationSwitch(SwitchEntity):
         return {
             "filtration_mode": self._filtration_mode,
         }
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
@@ -0,0 +1,56 @@
+"""Support for FlashForge text entities."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.text import TextEntity
+
+from .const import DOMAIN
+from .entity import FlashForgeEntity
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .data_update_coordinator import FlashForgeDataUpdateCoordinator
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up FlashForge text entities based on a config entry."""
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities([FlashForgeFileFilterText(coordinator)])
+
+
+class FlashForgeFileFilterText(FlashForgeEntity, TextEntity):
+    """Filter narrowing the files offered by the file select."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_icon = "mdi:file-search"
+    _attr_native_max = 100
+    # The filter is set locally; only availability follows the printer
+    _update_fields = frozenset()
+
+    def __init__(self, coordinator: FlashForgeDataUpdateCoordinator) -> None:
+        """Initialize the file filter entity."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.config_entry.unique_id}_file_filter"
+        self._attr_name = "File Filter"
+        self._attr_device_info = coordinator.device_info
+
+    @property
+    def native_value(self) -> str:
+        """Return the current filter."""
+        return self.coordinator.file_filter
+
+    async def async_set_value(self, value: str) -> None:
+        """Narrow the file select to files whose name contains the value."""
+        self.coordinator.async_set_file_filter(value)
+        self.async_write_ha_state()
@@ -0,0 +1,127 @@
+"""Thumbnail cache for FlashForge G-code files."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from time import monotonic
+from typing import TYPE_CHECKING, NamedTuple
+
+from .const import THUMBNAIL_CACHE_MAX_BYTES, THUMBNAIL_RETRY_INTERVAL
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+    from flashforge import FFMachineInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ThumbnailKey(NamedTuple):
+    """Identify the thumbnail of one version of a G-code file."""
+
+    file_name: str
+    # The printer reports neither size nor mtime; the sliced layer count changes
+    # whenever a file is re-sliced under the same name.
+    total_layers: int = 0
+
+    @classmethod
+    def from_info(cls, info: FFMachineInfo | None) -> ThumbnailKey | None:
+        """Return the key of the file being printed, if any."""
+        if info is None or not info.print_file_name:
+            return None
+        return cls(info.print_file_name, info.total_print_layers or 0)
+
+
+class ThumbnailCache:
+    """Byte-budgeted LRU cache of G-code thumbnails."""
+
+    def __init__(self, max_bytes: int = THUMBNAIL_CACHE_MAX_BYTES) -> None:
+        """Initialize an empty cache."""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        # Bumped on every change, so persistence knows when to write
+        self.version = 0
+        self._entries: OrderedDict[ThumbnailKey, bytes] = OrderedDict()
+        # Files without a thumbnail, with the time they may be retried
+        self._missing: dict[ThumbnailKey, float] = {}
+        self._pending: dict[ThumbnailKey, asyncio.Future[bytes | None]] = {}
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if a thumbnail is cached for the key."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached thumbnails."""
+        return len(self._entries)
+
+    def items(self) -> Iterator[tuple[ThumbnailKey, bytes]]:
+        """Iterate over cached thumbnails, least recently used first."""
+        return iter(self._entries.items())
+
+    def get(self, key: ThumbnailKey) -> bytes | None:
+        """Return a cached thumbnail and mark it as recently used."""
+        if (data := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+        return data
+
+    def put(self, key: ThumbnailKey, data: bytes) -> None:
+        """Store a thumbnail, evicting the least recently used ones if needed."""
+        if len(data) > self.max_bytes:
+            _LOGGER.debug("Thumbnail of %s exceeds the cache budget", key.file_name)
+            return
+        if (old := self._entries.pop(key, None)) is not None:
+            self.size -= len(old)
+        self._entries[key] = data
+        self._missing.pop(key, None)
+        self.size += len(data)
+        self.version += 1
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop all cached thumbnails."""
+        self._entries.clear()
+        self._missing.clear()
+        self.size = 0
+        self.version += 1
+
+    async def async_get_or_fetch(
+        self,
+        key: ThumbnailKey,
+        fetch: Callable[[], Awaitable[bytes | None]],
+    ) -> bytes | None:
+        """Return a cached thumbnail, fetching it at most once when missing."""
+        if (data := self.get(key)) is not None:
+            self.hits += 1
+            return data
+        if self._missing.get(key, 0) > monotonic():
+            return None
+        if (pending := self._pending.get(key)) is not None:
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future: asyncio.Future[bytes | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending[key] = future
+        try:
+            data = await fetch()
+        except BaseException:
+            # Concurrent waiters go without a thumbnail this time
+            future.set_result(None)
+            raise
+        else:
+            if data:
+                self.put(key, data)
+            else:
+                data = None
+                self._missing[key] = monotonic() + THUMBNAIL_RETRY_INTERVAL
+            future.set_result(data)
+            return data
+        finally:
+            del self._pending[key]
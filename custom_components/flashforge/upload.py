@@ -0,0 +1,380 @@
+"""Streaming uploads of G-code files to FlashForge printers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from itertools import batched
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import aiohttp
+from aiohttp import hdrs
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+from flashforge import Endpoints, NetworkUtils
+
+from .const import (
+    EVENT_UPLOAD_PROGRESS,
+    FLEET_UPLOAD_CONCURRENCY,
+    HTTP_TIMEOUT,
+    UPLOAD_BUFFER_CHUNKS,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_MIN_RATE,
+    UPLOAD_PROGRESS_STEP,
+    UPLOAD_RESPONSE_TIMEOUT,
+    UPLOAD_RETRIES,
+    UPLOAD_RETRY_DELAY,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Sequence
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+
+    from flashforge import FlashForgeClient
+
+    from .data_update_coordinator import FlashForgeDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Firmware from which the printer expects the material station headers
+_NEW_FIRMWARE = (3, 1, 3)
+
+
+class UploadTransferError(HomeAssistantError):
+    """The file could not be sent to the printer."""
+
+
+class UploadVerificationError(HomeAssistantError):
+    """The printer accepted a file that its file list does not confirm."""
+
+
+async def async_read_chunks(
+    hass: HomeAssistant, path: Path, chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Read a file in the executor, holding one chunk of it at a time."""
+    file = await hass.async_add_executor_job(path.open, "rb")
+    try:
+        while chunk := await hass.async_add_executor_job(file.read, chunk_size):
+            yield chunk
+    finally:
+        await hass.async_add_executor_job(file.close)
+
+
+class FileBroadcast:
+    """
+    Read a file once for several uploads of it.
+
+    Each chunk read is handed to every subscribed upload through a small
+    queue. Reading waits for the slowest upload, so the uploads advance
+    together and only a few chunks are held in memory. An upload that ends
+    early, e.g. on an error, unsubscribes so it does not hold the others back.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        """Initialize a broadcast that has not started reading."""
+        self.hass = hass
+        self.path = path
+        self.reads = 0
+        self._queues: set[asyncio.Queue[bytes | None]] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._error: OSError | None = None
+
+    @callback
+    def async_subscribe(self) -> asyncio.Queue[bytes | None]:
+        """Return the queue of an upload; all subscribe before reading starts."""
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(UPLOAD_BUFFER_CHUNKS)
+        self._queues.add(queue)
+        return queue
+
+    @callback
+    def async_unsubscribe(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """Stop handing chunks to an upload."""
+        self._queues.discard(queue)
+        # Release a read waiting for room in the queue
+        while not queue.empty():
+            queue.get_nowait()
+
+    async def async_chunks(
+        self, queue: asyncio.Queue[bytes | None]
+    ) -> AsyncIterator[bytes]:
+        """Yield the chunks of the file handed to an upload."""
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_read(), f"flashforge upload {self.path.name}"
+            )
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+        if self._error is not None:
+            raise self._error
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop reading the file."""
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _async_read(self) -> None:
+        """Read the file and hand every chunk to the subscribed uploads."""
+        try:
+            async for chunk in async_read_chunks(self.hass, self.path):
+                self.reads += 1
+                for queue in tuple(self._queues):
+                    if queue in self._queues:
+                        await queue.put(chunk)
+        except OSError as err:
+            self._error = err
+        for queue in tuple(self._queues):
+            await queue.put(None)
+
+
+@dataclass(slots=True)
+class UploadResult:
+    """Outcome of uploading a file to one printer."""
+
+    name: str
+    success: bool = False
+    attempts: int = 0
+    error: str | None = None
+
+
+async def _async_upload_with_retries(
+    coordinator: FlashForgeDataUpdateCoordinator,
+    broadcast: FileBroadcast,
+    size: int,
+    *,
+    start_print: bool,
+    leveling_before_print: bool,
+) -> UploadResult:
+    """
+    Upload a shared file to a printer, retrying from a read of its own.
+
+    Only failures to send the file are retried. A refused or unverified
+    upload is reported as it is.
+    """
+    result = UploadResult(coordinator.config_entry.title)
+    path = broadcast.path
+    queue = broadcast.async_subscribe()
+    chunks: AsyncIterable[bytes] = broadcast.async_chunks(queue)
+    try:
+        while True:
+            result.attempts += 1
+            try:
+                await coordinator.async_upload_file(
+                    path.name,
+                    chunks,
+                    size,
+                    start_print=start_print,
+                    leveling_before_print=leveling_before_print,
+                )
+            except UploadTransferError as err:
+                result.error = str(err)
+                broadcast.async_unsubscribe(queue)
+                if result.attempts > UPLOAD_RETRIES:
+                    return result
+                _LOGGER.debug("Retrying upload of %s: %s", path.name, err)
+                await asyncio.sleep(UPLOAD_RETRY_DELAY)
+                chunks = async_read_chunks(coordinator.hass, path)
+            except HomeAssistantError as err:
+                # The printer may hold the file; sending it again could start
+                # a second print
+                result.error = str(err)
+                return result
+            else:
+                result.success = True
+                result.error = None
+                return result
+    finally:
+        broadcast.async_unsubscribe(queue)
+
+
+async def async_upload_to_fleet(
+    coordinators: Sequence[FlashForgeDataUpdateCoordinator],
+    path: Path,
+    size: int,
+    *,
+    start_print: bool = False,
+    leveling_before_print: bool = False,
+) -> dict[str, UploadResult]:
+    """
+    Upload a file to several printers, returning the result by config entry.
+
+    Printers are sent to FLEET_UPLOAD_CONCURRENCY at a time, and the printers
+    of each batch share one read of the file. Every upload of a batch
+    subscribes to the read as its task starts, before the first chunk is read.
+    """
+    results: dict[str, UploadResult] = {}
+    for batch in batched(coordinators, FLEET_UPLOAD_CONCURRENCY, strict=False):
+        broadcast = FileBroadcast(batch[0].hass, path)
+        try:
+            outcomes = await asyncio.gather(
+                *(
+                    _async_upload_with_retries(
+                        coordinator,
+                        broadcast,
+                        size,
+                        start_print=start_print,
+                        leveling_before_print=leveling_before_print,
+                    )
+                    for coordinator in batch
+                )
+            )
+        finally:
+            broadcast.async_stop()
+        _LOGGER.debug("Read %s once for %s printers", path.name, len(batch))
+        for coordinator, outcome in zip(batch, outcomes, strict=True):
+            results[coordinator.config_entry.entry_id] = outcome
+    return results
+
+
+class UploadProgress:
+    """Fire progress events as the chunks of an upload are sent."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, name: str, total: int
+    ) -> None:
+        """Initialize the progress of an upload that has not started."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self.name = name
+        self.total = total
+        self.sent = 0
+        self._reported = -UPLOAD_PROGRESS_STEP
+
+    @property
+    def percent(self) -> int:
+        """Return the share of the file sent so far."""
+        return 100 * self.sent // self.total if self.total else 100
+
+    async def async_track(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """Pass the chunks through, counting them as they are sent."""
+        async for chunk in chunks:
+            yield chunk
+            self.sent += len(chunk)
+            self.async_report()
+
+    @callback
+    def async_report(self) -> None:
+        """Fire a progress event once the upload advanced a full step."""
+        percent = self.percent
+        if percent < self._reported + UPLOAD_PROGRESS_STEP and percent < 100:  # noqa: PLR2004
+            return
+        self._reported = percent
+        self.hass.bus.async_fire(
+            EVENT_UPLOAD_PROGRESS,
+            {
+                "entry_id": self.entry_id,
+                "file_name": self.name,
+                "bytes_sent": self.sent,
+                "total_bytes": self.total,
+                "progress": percent,
+            },
+        )
+
+
+def _is_new_firmware(version: str) -> bool:
+    """Return True if the firmware expects the material station headers."""
+    try:
+        parts = tuple(int(part) for part in version.split("."))
+    except ValueError:
+        return False
+    return parts >= _NEW_FIRMWARE
+
+
+def upload_headers(
+    client: FlashForgeClient,
+    size: int,
+    *,
+    start_print: bool,
+    leveling_before_print: bool,
+) -> dict[str, str]:
+    """Return the headers describing an upload to the printer."""
+    headers = {
+        "serialNumber": client.serial_number,
+        "checkCode": client.check_code,
+        "fileSize": str(size),
+        "printNow": str(start_print).lower(),
+        "levelingBeforePrint": str(leveling_before_print).lower(),
+    }
+    if _is_new_firmware(client.firmware_ver):
+        headers |= {
+            "flowCalibration": "false",
+            "useMatlStation": "false",
+            "gcodeToolCnt": "0",
+            # Base64 of an empty list of material mappings
+            "materialMappings": "W10=",
+        }
+    return headers
+
+
+async def _async_multipart(
+    name: str, chunks: AsyncIterable[bytes], boundary: str
+) -> AsyncIterator[bytes]:
+    """Frame the chunks of a file as the one part of a multipart form."""
+    yield _part_head(name, boundary)
+    async for chunk in chunks:
+        yield chunk
+    yield _part_tail(boundary)
+
+
+def _part_head(name: str, boundary: str) -> bytes:
+    """Return the headers opening the file part of the form."""
+    filename = name.replace("\\", "\\\\").replace('"', '\\"')
+    return (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="gcodeFile"; filename="{filename}"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+
+
+def _part_tail(boundary: str) -> bytes:
+    """Return the bytes closing the form."""
+    return f"\r\n--{boundary}--\r\n".encode()
+
+
+async def async_post_file(
+    session: aiohttp.ClientSession,
+    client: FlashForgeClient,
+    name: str,
+    chunks: AsyncIterable[bytes],
+    headers: dict[str, str],
+) -> bool:
+    """
+    Stream a file to the printer, returning True if the printer accepted it.
+
+    The library reads the file with blocking calls in the event loop. Here the
+    chunks are sent as they are read, so the file is never held in memory
+    whole. The form is framed by hand so its length is known up front: the
+    printer gets a Content-Length and Expect: 100-continue as with the
+    library, not a chunked body. The whole request must finish within a
+    deadline scaled to the file size, so a stalled printer cannot hang it.
+    An HTTP error status, meaning the printer did not take the file, raises
+    ClientResponseError.
+    """
+    size = int(headers["fileSize"])
+    boundary = uuid4().hex
+    length = len(_part_head(name, boundary)) + size + len(_part_tail(boundary))
+    async with session.post(
+        client.get_endpoint(Endpoints.UPLOAD_FILE),
+        data=_async_multipart(name, chunks, boundary),
+        headers=headers
+        | {
+            hdrs.CONTENT_TYPE: f"multipart/form-data; boundary={boundary}",
+            hdrs.CONTENT_LENGTH: str(length),
+        },
+        expect100=True,
+        timeout=aiohttp.ClientTimeout(
+            total=UPLOAD_RESPONSE_TIMEOUT + size / UPLOAD_MIN_RATE,
+            sock_connect=HTTP_TIMEOUT,
+        ),
+    ) as response:
+        response.raise_for_status()
+        # Some printers send a misspelled JSON content type
+        result = json.loads(await response.text())
+    _LOGGER.debug("Upload of %s answered with: %s", name, result)
+    return NetworkUtils.is_ok(result)
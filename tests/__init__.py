@@ -7,6 +7,7 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_IP_ADDRESS
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.flashforge.const import CONF_SERIAL_NUMBER, DOMAIN
@@ -61,3 +62,23 @@ async def init_integration(
         await hass.async_block_till_done()
 
     return entry
+
+
+async def init_fleet(hass: HomeAssistant) -> list[str]:
+    """Set up two Flashforge printers and return their device ids."""
+    await init_integration(hass)
+    entry = MockConfigEntry(
+        title="Adventurer5",
+        domain=DOMAIN,
+        unique_id="SNADVA7654321",
+        data={CONF_IP_ADDRESS: "127.0.0.2", CONF_SERIAL_NUMBER: "SNADVA7654321"},
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    registry = dr.async_get(hass)
+    return [
+        device.id
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        for device in dr.async_entries_for_config_entry(registry, entry.entry_id)
+    ]
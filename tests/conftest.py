@@ -52,11 +52,13 @@ def mock_flashforge_client() -> Generator[MagicMock | AsyncMock]:
             )
         )
         mock_instance.files.get_local_file_list = AsyncMock(return_value=[])
+        mock_instance.files.get_recent_file_list = AsyncMock(return_value=[])
         mock_instance.printer_name = "Adventurer4"
         mock_instance.serial_number = "SNADVA1234567"
         mock_instance.firmware_version = "v2.0.9"
         mock_instance.mac_address = "88:A9:A7:93:86:F8"
         mock_instance.ip_address = "127.0.0.1"
+        mock_instance.filtration_control = False
         yield mock_init_client_class
 
 
@@ -83,6 +85,8 @@ async def unload_integration(hass: HomeAssistant) -> AsyncGenerator[None]:
     """Try to unload the Flashforge integration after each test."""
     yield
 
+    # Let pending reloads (e.g. from an aborted duplicate flow) settle first.
+    await hass.async_block_till_done()
     entries = hass.config_entries.async_entries(DOMAIN)
     if entries:
         entry: ConfigEntry
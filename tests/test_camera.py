@@ -0,0 +1,219 @@
+"""Tests for the Flashforge camera."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer, make_mocked_request
+from flashforge import MachineState
+from flashforge.models.machine_info import FFMachineInfo
+from homeassistant.components.camera import async_get_image, async_get_stream_source
+from homeassistant.core import HomeAssistant
+
+from custom_components.flashforge.connection import FlashForgeConnection
+from custom_components.flashforge.const import CONF_USE_STREAM, DOMAIN
+from custom_components.flashforge.mjpeg import MjpegStreamHub
+
+from . import init_integration
+
+ENTITY_ID = "camera.camera"
+FRAME = b"\xff\xd8jpeg-data\xff\xd9"
+BOUNDARY = "frame"
+
+
+async def _mjpeg(request: web.Request) -> web.StreamResponse:
+    """Stream the same frame until the client goes away."""
+    request.app["connections"] += 1
+    response = web.StreamResponse(
+        headers={"Content-Type": f"multipart/x-mixed-replace; boundary={BOUNDARY}"}
+    )
+    await response.prepare(request)
+    for _ in range(100):
+        try:
+            await response.write(
+                f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                f"Content-Length: {len(FRAME)}\r\n\r\n".encode()
+                + FRAME
+                + b"\r\n"
+            )
+        except ConnectionResetError:
+            break
+        await asyncio.sleep(0.01)
+    return response
+
+
+async def _stalled(request: web.Request) -> web.StreamResponse:
+    """Open a stream that never sends a frame."""
+    response = web.StreamResponse(
+        headers={"Content-Type": f"multipart/x-mixed-replace; boundary={BOUNDARY}"}
+    )
+    await response.prepare(request)
+    await asyncio.sleep(60)
+    return response
+
+
+@pytest_asyncio.fixture
+async def camera_server(socket_enabled: Any) -> AsyncGenerator[TestServer]:  # noqa: ARG001
+    """Serve an MJPEG stream like the printer's camera."""
+    app = web.Application()
+    app["connections"] = 0
+    app.router.add_get("/", _mjpeg)
+    app.router.add_get("/stalled", _stalled)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_camera_snapshot(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    camera_server: TestServer,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test snapshots are read off the stream once, then served from the cache."""
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        machine_state=MachineState.READY,
+        camera_stream_url=str(camera_server.make_url("/")),
+    )
+    await init_integration(hass)
+
+    images = await asyncio.gather(*(async_get_image(hass, ENTITY_ID) for _ in range(3)))
+
+    assert [image.content for image in images] == [FRAME] * 3  # noqa: S101
+    assert camera_server.app["connections"] == 1  # noqa: S101
+
+    # A stale frame is read again.
+    with patch("custom_components.flashforge.mjpeg.monotonic", return_value=1e9):
+        await async_get_image(hass, ENTITY_ID)
+    assert camera_server.app["connections"] == 2  # noqa: S101, PLR2004
+
+
+@pytest.mark.asyncio
+async def test_stream_hub_fan_out(
+    hass: HomeAssistant, camera_server: TestServer
+) -> None:
+    """Test viewers share one upstream connection, closed after the last leaves."""
+    connection = FlashForgeConnection(hass, MagicMock())
+    hub = MjpegStreamHub(hass, connection)
+    url = str(camera_server.make_url("/"))
+
+    async with (
+        hub.async_subscribe(url) as first,
+        hub.async_subscribe(url) as second,
+    ):
+        assert await first.get() == FRAME  # noqa: S101
+        assert await second.get() == FRAME  # noqa: S101
+        assert hub.viewers == 2  # noqa: S101, PLR2004
+
+    assert hub.viewers == 0  # noqa: S101
+    assert hub.connects == 1  # noqa: S101
+    assert camera_server.app["connections"] == 1  # noqa: S101
+    await connection.session.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_hub_stopped(
+    hass: HomeAssistant, camera_server: TestServer
+) -> None:
+    """Test stopping the hub ends the stream of a viewer waiting for a frame."""
+    connection = FlashForgeConnection(hass, MagicMock())
+    hub = MjpegStreamHub(hass, connection)
+
+    async with hub.async_subscribe(str(camera_server.make_url("/stalled"))) as frames:
+        waiting = asyncio.create_task(frames.get())
+        await asyncio.sleep(0.05)
+        hub.async_stop()
+        async with asyncio.timeout(1):
+            assert await waiting is None  # noqa: S101
+
+    assert hub.viewers == 0  # noqa: S101
+    await connection.session.close()
+
+
+@pytest.mark.asyncio
+async def test_camera_stream_stalled(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    camera_server: TestServer,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a viewer of a camera that stopped sending frames is let go."""
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        machine_state=MachineState.READY,
+        camera_stream_url=str(camera_server.make_url("/stalled")),
+    )
+    entry = await init_integration(hass)
+    camera = hass.data["entity_components"]["camera"].get_entity(ENTITY_ID)
+    hub = hass.data[DOMAIN][entry.entry_id].stream_hub
+
+    with patch("custom_components.flashforge.camera.MJPEG_FRAME_TIMEOUT", 0.1):
+        async with asyncio.timeout(1):
+            await camera.handle_async_mjpeg_stream(make_mocked_request("GET", "/"))
+
+    # The upstream connection closed with its last viewer
+    assert hub.viewers == 0  # noqa: S101
+    await hass.async_block_till_done()
+    assert hub.connects == 1  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_camera_snapshot_scaled(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    camera_server: TestServer,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test snapshots are downscaled once per scaling factor of a frame."""
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        machine_state=MachineState.READY,
+        camera_stream_url=str(camera_server.make_url("/")),
+    )
+    await init_integration(hass)
+    turbo_jpeg = MagicMock()
+    turbo_jpeg.decode_header.side_effect = lambda image: (
+        (640, 480, 0, 0) if image == FRAME else (320, 240, 0, 0)
+    )
+    turbo_jpeg.scale_with_quality.return_value = b"small"
+
+    with patch(
+        "custom_components.flashforge.mjpeg.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ):
+        # Both sizes take the 1/2 factor of the 640x480 frame
+        small = await async_get_image(hass, ENTITY_ID, width=320, height=240)
+        similar = await async_get_image(hass, ENTITY_ID, width=300, height=200)
+
+    assert small.content == similar.content == b"small"  # noqa: S101
+    turbo_jpeg.scale_with_quality.assert_called_once_with(
+        FRAME, scaling_factor=(1, 2), quality=75
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_stream", [True, False])
+async def test_camera_stream_source(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+    *,
+    use_stream: bool,
+) -> None:
+    """Test the stream worker gets the camera URL only when enabled in options."""
+    url = "http://127.0.0.1:8080/?action=stream"
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        machine_state=MachineState.READY, camera_stream_url=url
+    )
+    entry = await init_integration(hass, skip_setup=True)
+    hass.config_entries.async_update_entry(entry, options={CONF_USE_STREAM: use_stream})
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    source = await async_get_stream_source(hass, ENTITY_ID)
+
+    assert source == (url if use_stream else None)  # noqa: S101
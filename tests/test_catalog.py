@@ -0,0 +1,59 @@
+"""Tests for the Flashforge file catalog."""
+
+from flashforge import FFGcodeFileEntry
+
+from custom_components.flashforge.catalog import FileCatalog
+
+
+def test_sync_applies_diffs() -> None:
+    """Test a file list is applied as a diff that keeps known metadata."""
+    catalog = FileCatalog()
+    assert catalog.async_sync(["/data/cube.gcode", "/data/benchy.gcode"])  # noqa: S101
+    catalog.async_update_details(
+        [FFGcodeFileEntry(gcode_file_name="cube.gcode", printing_time=600)]
+    )
+
+    # The same files in another order are no change.
+    assert not catalog.async_sync(["/data/benchy.gcode", "/data/cube.gcode"])  # noqa: S101
+    assert catalog.version == 1  # noqa: S101
+
+    assert catalog.async_sync(["/data/cube.gcode", "/data/vase.gcode"])  # noqa: S101
+    assert "benchy.gcode" not in catalog  # noqa: S101
+    assert "vase.gcode" in catalog  # noqa: S101
+    entry = catalog.get("cube.gcode")
+    assert entry is not None  # noqa: S101
+    assert entry.printing_time == 600  # noqa: S101, PLR2004
+    assert catalog.paths == ("/data/cube.gcode", "/data/vase.gcode")  # noqa: S101
+
+
+def test_refresh_cadence() -> None:
+    """Test the file list is due after the interval or an invalidation."""
+    catalog = FileCatalog(interval=300)
+    assert catalog.refresh_due()  # noqa: S101
+
+    # A list restored from storage still needs a fresh one.
+    catalog.async_sync(["/data/cube.gcode"], complete=False)
+    assert catalog.refresh_due()  # noqa: S101
+
+    catalog.async_sync(["/data/cube.gcode"])
+    assert not catalog.refresh_due()  # noqa: S101
+
+    catalog.async_invalidate()
+    assert catalog.refresh_due()  # noqa: S101
+
+
+def test_search_recent_first() -> None:
+    """Test a search returns a bounded window of matches, recently used first."""
+    catalog = FileCatalog()
+    catalog.async_sync([f"/data/part{i}.gcode" for i in range(10)] + ["/data/cube"])
+    revision = catalog.revision
+    catalog.async_mark_used("part7.gcode")
+
+    # Using a file changes the order, so the revision moves
+    assert catalog.revision == revision + 1  # noqa: S101
+    assert [entry.name for entry in catalog.search("PART", 3)] == [  # noqa: S101
+        "part7.gcode",
+        "part0.gcode",
+        "part1.gcode",
+    ]
+    assert len(catalog.search()) == 11  # noqa: S101, PLR2004
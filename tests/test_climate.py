@@ -0,0 +1,48 @@
+"""Tests for the Flashforge climate entities."""
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pytest
+from flashforge import Temperature
+from homeassistant.components.climate import ATTR_CURRENT_TEMPERATURE, HVACMode
+from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import HomeAssistant
+
+from custom_components.flashforge.const import DOMAIN
+
+from . import init_integration
+
+if TYPE_CHECKING:
+    from custom_components.flashforge.data_update_coordinator import (
+        FlashForgeDataUpdateCoordinator,
+    )
+
+
+@pytest.mark.asyncio
+async def test_climate_follows_coordinator(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test the climate entities show the reported temperatures."""
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    state = hass.states.get("climate.adventurer4_bed")
+    assert state is not None  # noqa: S101
+    assert state.state == HVACMode.HEAT  # noqa: S101
+    assert state.attributes[ATTR_CURRENT_TEMPERATURE] == 55.0  # noqa: S101, PLR2004
+    assert state.attributes[ATTR_TEMPERATURE] == 60.0  # noqa: S101, PLR2004
+
+    info = mock_flashforge_client.return_value.get_printer_status.return_value
+    mock_flashforge_client.return_value.get_printer_status.return_value = (
+        info.model_copy(update={"extruder": Temperature(current=25.0, set=0.0)})
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get("climate.adventurer4_extruder")
+    assert state is not None  # noqa: S101
+    assert state.state == HVACMode.OFF  # noqa: S101
+    assert state.attributes[ATTR_CURRENT_TEMPERATURE] == 25.0  # noqa: S101, PLR2004
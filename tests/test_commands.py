@@ -0,0 +1,93 @@
+"""Tests for the Flashforge command handling."""
+
+import asyncio
+from datetime import timedelta
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.flashforge.commands import (
+    CommandCoalescer,
+    CommandPriority,
+    CommandQueue,
+)
+from custom_components.flashforge.const import COMMAND_COALESCE_DELAY
+
+
+@pytest.mark.asyncio
+async def test_coalesce_slider_commands(hass: HomeAssistant) -> None:
+    """Test a dragged slider sends only its last value, confirmed once."""
+    confirm = MagicMock()
+    set_speed = AsyncMock()
+    set_fan = AsyncMock()
+    coalescer = CommandCoalescer(hass, CommandQueue().async_execute, confirm)
+
+    for speed in range(50, 110, 10):
+        await coalescer.async_send("print_speed", partial(set_speed, speed))
+    await coalescer.async_send("cooling_fan_speed", partial(set_fan, 40))
+
+    set_speed.assert_not_awaited()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=COMMAND_COALESCE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    set_speed.assert_awaited_once_with(100)
+    set_fan.assert_awaited_once_with(40)
+    assert confirm.call_count == 2  # noqa: S101, PLR2004
+    coalescer.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queue_runs_safety_commands_first() -> None:
+    """Test queued commands are sent one at a time, safety commands first."""
+    queue = CommandQueue()
+    sent: list[str] = []
+    release = asyncio.Event()
+
+    async def command(name: str) -> str:
+        sent.append(name)
+        if name == "busy":
+            await release.wait()
+        return name
+
+    busy = asyncio.create_task(queue.async_execute(command, "busy"))
+    await asyncio.sleep(0)
+    led = asyncio.create_task(
+        queue.async_execute(command, "led", priority=CommandPriority.COSMETIC)
+    )
+    cancel = asyncio.create_task(
+        queue.async_execute(command, "cancel", priority=CommandPriority.SAFETY)
+    )
+    await asyncio.sleep(0)
+    assert queue.depth == 3  # noqa: S101, PLR2004
+    assert sent == ["busy"]  # noqa: S101
+
+    release.set()
+    assert await asyncio.gather(busy, led, cancel) == ["busy", "led", "cancel"]  # noqa: S101
+    assert sent == ["busy", "cancel", "led"]  # noqa: S101
+    assert queue.depth == 0  # noqa: S101
+    assert queue.completed == 3  # noqa: S101, PLR2004
+
+
+@pytest.mark.asyncio
+async def test_queue_command_deadline() -> None:
+    """Test a command waiting past its deadline is never sent."""
+    queue = CommandQueue(timeout=0.01)
+    stuck = AsyncMock(side_effect=asyncio.Event().wait)
+    late = AsyncMock()
+
+    results = await asyncio.gather(
+        queue.async_execute(stuck),
+        queue.async_execute(late),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, TimeoutError) for result in results)  # noqa: S101
+    late.assert_not_awaited()
+    assert queue.timed_out == 2  # noqa: S101, PLR2004
+    assert queue.depth == 0  # noqa: S101
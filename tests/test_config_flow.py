@@ -12,30 +12,34 @@ from homeassistant.const import CONF_IP_ADDRESS, CONF_SOURCE
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
-from custom_components.flashforge.const import CONF_SERIAL_NUMBER, DOMAIN
+from custom_components.flashforge.const import (
+    CONF_SERIAL_NUMBER,
+    CONF_SNAPSHOT_MAX_AGE,
+    DOMAIN,
+)
 
 from . import init_integration
 
 
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("mock_flashforge_client", "enable_custom_integrations")
-async def test_user_flow(hass: HomeAssistant, mock_flashforge_client: MagicMock) -> None:
+async def test_user_flow(
+    hass: HomeAssistant, mock_flashforge_client: MagicMock
+) -> None:
     """Test the manual user flow."""
-    mock_flashforge_client.return_value.get_printer_status.return_value = (
-        FFMachineInfo(
-            name="Adventurer4",
-            firmware_version="v2.0.9",
-            machine_state=MachineState.PRINTING,
-            extruder=Temperature(current=215.0, set=220.0),
-            print_bed=Temperature(current=55.0, set=60.0),
-            print_progress=50,
-            print_file_name="test.gcode",
-            current_print_layer=10,
-            total_print_layers=100,
-            estimated_time=3600,
-            print_eta="2025-11-29T19:00:00+00:00",
-            print_duration=1800,
-        )
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        name="Adventurer4",
+        firmware_version="v2.0.9",
+        machine_state=MachineState.PRINTING,
+        extruder=Temperature(current=215.0, set=220.0),
+        print_bed=Temperature(current=55.0, set=60.0),
+        print_progress=50,
+        print_file_name="test.gcode",
+        current_print_layer=10,
+        total_print_layers=100,
+        estimated_time=3600,
+        print_eta="2025-11-29T19:00:00+00:00",
+        print_duration=1800,
     )
     mock_flashforge_client.return_value.files.get_local_file_list.return_value = []
 
@@ -72,21 +76,19 @@ async def test_user_flow_auto_discover(
     hass: HomeAssistant, mock_flashforge_client: MagicMock
 ) -> None:
     """Test the auto discovery in manual user flow."""
-    mock_flashforge_client.return_value.get_printer_status.return_value = (
-        FFMachineInfo(
-            name="Adventurer4",
-            firmware_version="v2.0.9",
-            machine_state=MachineState.PRINTING,
-            extruder=Temperature(current=215.0, set=220.0),
-            print_bed=Temperature(current=55.0, set=60.0),
-            print_progress=50,
-            print_file_name="test.gcode",
-            current_print_layer=10,
-            total_print_layers=100,
-            estimated_time=3600,
-            print_eta="2025-11-29T19:00:00+00:00",
-            print_duration=1800,
-        )
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        name="Adventurer4",
+        firmware_version="v2.0.9",
+        machine_state=MachineState.PRINTING,
+        extruder=Temperature(current=215.0, set=220.0),
+        print_bed=Temperature(current=55.0, set=60.0),
+        print_progress=50,
+        print_file_name="test.gcode",
+        current_print_layer=10,
+        total_print_layers=100,
+        estimated_time=3600,
+        print_eta="2025-11-29T19:00:00+00:00",
+        print_duration=1800,
     )
     mock_flashforge_client.return_value.files.get_local_file_list.return_value = []
 
@@ -133,21 +135,19 @@ async def test_auto_discover_no_devices(
 ) -> None:
     """Test the auto discovery didn't find any devices."""
     mock_printer_discovery.discover_printers_async.return_value = []
-    mock_flashforge_client.return_value.get_printer_status.return_value = (
-        FFMachineInfo(
-            name="Adventurer4",
-            firmware_version="v2.0.9",
-            machine_state=MachineState.PRINTING,
-            extruder=Temperature(current=215.0, set=220.0),
-            print_bed=Temperature(current=55.0, set=60.0),
-            print_progress=50,
-            print_file_name="test.gcode",
-            current_print_layer=10,
-            total_print_layers=100,
-            estimated_time=3600,
-            print_eta="2025-11-29T19:00:00+00:00",
-            print_duration=1800,
-        )
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        name="Adventurer4",
+        firmware_version="v2.0.9",
+        machine_state=MachineState.PRINTING,
+        extruder=Temperature(current=215.0, set=220.0),
+        print_bed=Temperature(current=55.0, set=60.0),
+        print_progress=50,
+        print_file_name="test.gcode",
+        current_print_layer=10,
+        total_print_layers=100,
+        estimated_time=3600,
+        print_eta="2025-11-29T19:00:00+00:00",
+        print_duration=1800,
     )
     mock_flashforge_client.return_value.files.get_local_file_list.return_value = []
 
@@ -236,21 +236,19 @@ async def test_user_device_exists_abort(
     hass: HomeAssistant, mock_flashforge_client: MagicMock
 ) -> None:
     """Test if device is already configured."""
-    mock_flashforge_client.return_value.get_printer_status.return_value = (
-        FFMachineInfo(
-            name="Adventurer4",
-            firmware_version="v2.0.9",
-            machine_state=MachineState.PRINTING,
-            extruder=Temperature(current=215.0, set=220.0),
-            print_bed=Temperature(current=55.0, set=60.0),
-            print_progress=50,
-            print_file_name="test.gcode",
-            current_print_layer=10,
-            total_print_layers=100,
-            estimated_time=3600,
-            print_eta="2025-11-29T19:00:00+00:00",
-            print_duration=1800,
-        )
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        name="Adventurer4",
+        firmware_version="v2.0.9",
+        machine_state=MachineState.PRINTING,
+        extruder=Temperature(current=215.0, set=220.0),
+        print_bed=Temperature(current=55.0, set=60.0),
+        print_progress=50,
+        print_file_name="test.gcode",
+        current_print_layer=10,
+        total_print_layers=100,
+        estimated_time=3600,
+        print_eta="2025-11-29T19:00:00+00:00",
+        print_duration=1800,
     )
     mock_flashforge_client.return_value.files.get_local_file_list.return_value = []
 
@@ -274,21 +272,19 @@ async def test_unload_integration(
     hass: HomeAssistant, mock_flashforge_client: MagicMock
 ) -> None:
     """Test of unload integration."""
-    mock_flashforge_client.return_value.get_printer_status.return_value = (
-        FFMachineInfo(
-            name="Adventurer4",
-            firmware_version="v2.0.9",
-            machine_state=MachineState.PRINTING,
-            extruder=Temperature(current=215.0, set=220.0),
-            print_bed=Temperature(current=55.0, set=60.0),
-            print_progress=50,
-            print_file_name="test.gcode",
-            current_print_layer=10,
-            total_print_layers=100,
-            estimated_time=3600,
-            print_eta="2025-11-29T19:00:00+00:00",
-            print_duration=1800,
-        )
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        name="Adventurer4",
+        firmware_version="v2.0.9",
+        machine_state=MachineState.PRINTING,
+        extruder=Temperature(current=215.0, set=220.0),
+        print_bed=Temperature(current=55.0, set=60.0),
+        print_progress=50,
+        print_file_name="test.gcode",
+        current_print_layer=10,
+        total_print_layers=100,
+        estimated_time=3600,
+        print_eta="2025-11-29T19:00:00+00:00",
+        print_duration=1800,
     )
     mock_flashforge_client.return_value.files.get_local_file_list.return_value = []
 
@@ -297,6 +293,8 @@ async def test_unload_integration(
     assert entry.state is ConfigEntryState.LOADED  # noqa: S101
     await hass.config_entries.async_unload(entry.entry_id)
     assert entry.state is ConfigEntryState.NOT_LOADED  # noqa: S101
+    # Unloading closes the TCP and HTTP connections of the client
+    mock_flashforge_client.return_value.dispose.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -305,13 +303,31 @@ async def test_printer_not_responding(
     hass: HomeAssistant, mock_flashforge_client: MagicMock
 ) -> None:
     """Test if printer not responding during setup."""
-    mock_flashforge_client.return_value.get_printer_status.side_effect = ConnectionError(
-        "conn_error"
+    mock_flashforge_client.return_value.get_printer_status.side_effect = (
+        ConnectionError("conn_error")
     )
     entry = await init_integration(hass)
 
     assert entry.state is ConfigEntryState.SETUP_RETRY  # noqa: S101
 
-    mock_flashforge_client.return_value.get_printer_status.side_effect = TimeoutError("timeout")
+    mock_flashforge_client.return_value.get_printer_status.side_effect = TimeoutError(
+        "timeout"
+    )
     entry = await init_integration(hass)
-    assert entry.state is ConfigEntryState.SETUP_RETRY  # noqa: S101
\ No newline at end of file
+    assert entry.state is ConfigEntryState.SETUP_RETRY  # noqa: S101
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_flashforge_client", "enable_custom_integrations")
+async def test_options_flow(hass: HomeAssistant) -> None:
+    """Test the camera options are stored on the entry."""
+    entry = await init_integration(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM  # noqa: S101
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_SNAPSHOT_MAX_AGE: 5}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY  # noqa: S101
+    assert entry.options[CONF_SNAPSHOT_MAX_AGE] == 5  # noqa: S101, PLR2004
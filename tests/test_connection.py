@@ -0,0 +1,22 @@
+"""Tests for the Flashforge connection manager."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.flashforge.connection import FlashForgeConnection
+
+
+@pytest.mark.asyncio
+async def test_session_pooled_per_printer(hass: HomeAssistant) -> None:
+    """Test one HTTP session is reused until the connection is closed."""
+    client = MagicMock(dispose=AsyncMock())
+    connection = FlashForgeConnection(hass, client)
+
+    session = connection.session
+    assert connection.session is session  # noqa: S101
+
+    await connection.async_close()
+    assert session.closed  # noqa: S101
+    client.dispose.assert_awaited_once()
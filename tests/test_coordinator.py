@@ -0,0 +1,335 @@
+"""Tests for the Flashforge data update coordinator."""
+
+from base64 import b64encode
+from datetime import timedelta
+from time import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+from flashforge import MachineState
+from flashforge.models.machine_info import FFMachineInfo, Temperature
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.flashforge.circuit_breaker import BreakerState
+from custom_components.flashforge.const import (
+    CONNECT_RETRIES,
+    DOMAIN,
+    FLEET_POLL_JITTER,
+    MAX_FAILED_UPDATES,
+    SCAN_INTERVAL_ACTIVE,
+    SCAN_INTERVAL_BURST,
+    SCAN_INTERVAL_IDLE,
+    SCAN_INTERVAL_OFFLINE,
+)
+from custom_components.flashforge.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from . import init_integration
+
+if TYPE_CHECKING:
+    from custom_components.flashforge.data_update_coordinator import (
+        FlashForgeDataUpdateCoordinator,
+    )
+
+
+@pytest.mark.asyncio
+async def test_adaptive_polling_interval(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test the polling cadence follows the machine state."""
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Printing polls at the fast cadence.
+    assert coordinator.data.is_printing  # noqa: S101
+    assert coordinator.cadence == SCAN_INTERVAL_ACTIVE  # noqa: S101
+
+    # Idle polls at the slow cadence.
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        machine_state=MachineState.READY
+    )
+    await coordinator.async_refresh()
+    assert coordinator.cadence == SCAN_INTERVAL_IDLE  # noqa: S101
+    # Each poll is jittered so printers do not poll in lockstep.
+    assert coordinator.update_interval is not None  # noqa: S101
+    jitter = coordinator.update_interval.total_seconds() - SCAN_INTERVAL_IDLE
+    assert abs(jitter) <= FLEET_POLL_JITTER * SCAN_INTERVAL_IDLE  # noqa: S101
+
+    # A command starts a short burst of fast polls, without waiting for the
+    # idle poll.
+    polls = mock_flashforge_client.return_value.get_printer_status.await_count
+    coordinator.async_start_burst()
+    assert coordinator.cadence == SCAN_INTERVAL_BURST  # noqa: S101
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SCAN_INTERVAL_BURST)
+    )
+    await hass.async_block_till_done()
+    assert (  # noqa: S101
+        mock_flashforge_client.return_value.get_printer_status.await_count == polls + 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_heating_polls_fast(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a heater warming up an idle printer polls at the fast cadence."""
+    client = mock_flashforge_client.return_value
+    client.get_printer_status.return_value = FFMachineInfo(
+        machine_state=MachineState.READY,
+        print_bed=Temperature(current=25.0, set=60.0),
+    )
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    assert coordinator.data.is_heating  # noqa: S101
+    assert not coordinator.data.is_printing  # noqa: S101
+    assert coordinator.cadence == SCAN_INTERVAL_ACTIVE  # noqa: S101
+
+    # Once the bed reached its target the printer is idle again.
+    client.get_printer_status.return_value = FFMachineInfo(
+        machine_state=MachineState.READY,
+        print_bed=Temperature(current=60.0, set=60.0),
+    )
+    await coordinator.async_refresh()
+    assert not coordinator.data.is_heating  # noqa: S101
+    assert coordinator.cadence == SCAN_INTERVAL_IDLE  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_unreachable_polling_backoff(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test the polling cadence backs off while the printer is unreachable."""
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    mock_flashforge_client.return_value.get_printer_status.side_effect = (
+        ConnectionError("conn_error")
+    )
+    for _ in range(MAX_FAILED_UPDATES):
+        await coordinator.async_refresh()
+    assert coordinator.breaker.state is BreakerState.OPEN  # noqa: S101
+    assert coordinator.cadence == SCAN_INTERVAL_OFFLINE  # noqa: S101
+    polls = mock_flashforge_client.return_value.get_printer_status.await_count
+
+    # While open, only a cheap probe is made, and the delay keeps doubling.
+    with patch.object(coordinator, "_async_probe", AsyncMock(return_value=False)):
+        await coordinator.async_refresh()
+    assert coordinator.cadence == SCAN_INTERVAL_OFFLINE * 2  # noqa: S101
+    assert (  # noqa: S101
+        mock_flashforge_client.return_value.get_printer_status.await_count == polls
+    )
+
+    # Back to the fast cadence once the printer answers again.
+    mock_flashforge_client.return_value.get_printer_status.side_effect = None
+    with patch.object(coordinator, "_async_probe", AsyncMock(return_value=True)):
+        await coordinator.async_refresh()
+    assert coordinator.breaker.state is BreakerState.CLOSED  # noqa: S101
+    assert coordinator.cadence == SCAN_INTERVAL_ACTIVE  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_missing_status_is_failed_poll(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a status the library could not fetch keeps the last snapshot."""
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data
+
+    mock_flashforge_client.return_value.get_printer_status.return_value = None
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success  # noqa: S101
+    assert coordinator.data is data  # noqa: S101
+    assert coordinator.breaker.failures == 1  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_missing_status_opens_breaker(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a printer that keeps returning no status is polled at the slow rate."""
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    polls = coordinator.fleet.polls
+
+    mock_flashforge_client.return_value.get_printer_status.return_value = None
+    for _ in range(MAX_FAILED_UPDATES):
+        await coordinator.async_refresh()
+
+    assert coordinator.breaker.state is BreakerState.OPEN  # noqa: S101
+    assert coordinator.cadence == SCAN_INTERVAL_OFFLINE  # noqa: S101
+    assert coordinator.fleet.polls == polls  # noqa: S101
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error", [aiohttp.ClientPayloadError("truncated"), ValueError("bad json")]
+)
+async def test_status_error_opens_breaker(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+    error: Exception,
+) -> None:
+    """Test any error of the status request counts against the breaker."""
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    mock_flashforge_client.return_value.get_printer_status.side_effect = error
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success  # noqa: S101
+    assert coordinator.breaker.failures == 1  # noqa: S101
+
+    for _ in range(MAX_FAILED_UPDATES - 1):
+        await coordinator.async_refresh()
+    assert not coordinator.last_update_success  # noqa: S101
+    assert coordinator.breaker.state is BreakerState.OPEN  # noqa: S101
+    assert hass.states.get("light.adventurer4_light").state == STATE_UNAVAILABLE  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_connect_retries(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test setup retries a failed connection a bounded number of times."""
+    initialize = mock_flashforge_client.return_value.initialize
+    initialize.side_effect = [False, True]
+    with patch("custom_components.flashforge.connection.CONNECT_RETRY_DELAY", 0):
+        entry = await init_integration(hass)
+    assert entry.state is ConfigEntryState.LOADED  # noqa: S101
+    await hass.config_entries.async_unload(entry.entry_id)
+
+    initialize.reset_mock()
+    initialize.side_effect = None
+    initialize.return_value = False
+    with patch("custom_components.flashforge.connection.CONNECT_RETRY_DELAY", 0):
+        entry = await init_integration(hass)
+    assert entry.state is ConfigEntryState.SETUP_RETRY  # noqa: S101
+    assert initialize.await_count == CONNECT_RETRIES  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_partial_update_keeps_stale_file_list(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a failing file list request does not fail the whole update."""
+    mock_flashforge_client.return_value.files.get_local_file_list.return_value = [
+        "cube.gcode"
+    ]
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    mock_flashforge_client.return_value.files.get_local_file_list.side_effect = (
+        TimeoutError("timeout")
+    )
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        machine_state=MachineState.READY
+    )
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success  # noqa: S101
+    assert coordinator.data.status == "ready"  # noqa: S101
+    assert not coordinator.data.is_printing  # noqa: S101
+    assert coordinator.data.files == ("cube.gcode",)  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_file_list_slow_cadence(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test the file list is not fetched on every poll, only when due."""
+    files = mock_flashforge_client.return_value.files
+    files.get_local_file_list.return_value = ["/data/test.gcode"]
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    assert files.get_local_file_list.await_count == 1  # noqa: S101
+
+    await coordinator.async_refresh()
+    assert files.get_local_file_list.await_count == 1  # noqa: S101
+
+    # A file printing that is not in the catalog was uploaded since.
+    mock_flashforge_client.return_value.get_printer_status.return_value = FFMachineInfo(
+        machine_state=MachineState.PRINTING, print_file_name="new.gcode"
+    )
+    await coordinator.async_refresh()
+    files.get_local_file_list.return_value = ["/data/test.gcode", "/data/new.gcode"]
+    await coordinator.async_refresh()
+    assert files.get_local_file_list.await_count == 2  # noqa: S101, PLR2004
+    assert "new.gcode" in coordinator.catalog  # noqa: S101
+    assert "files" in coordinator.changed_fields  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_thumbnail_restored_from_storage(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a persisted thumbnail is used instead of fetching it after a restart."""
+    hass_storage[f"{DOMAIN}.SNADVA1234567"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.SNADVA1234567",
+        "data": {
+            "files": ["test.gcode"],
+            "thumbnails": [
+                {
+                    "file_name": "test.gcode",
+                    "total_layers": 100,
+                    "added": time(),
+                    "image": b64encode(b"stored").decode(),
+                }
+            ],
+        },
+    }
+    get_thumbnail = AsyncMock(return_value=b"fresh")
+    mock_flashforge_client.return_value.files.get_gcode_thumbnail = get_thumbnail
+
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    assert coordinator.data.thumbnail == b"stored"  # noqa: S101
+    assert get_thumbnail.await_count == 0  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_diagnostics(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,  # noqa: ARG001
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test the diagnostics expose the command queue metrics."""
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.async_send_command(AsyncMock(return_value=True))
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["command_queue"]["completed"] == 1  # noqa: S101
+    assert diagnostics["command_queue"]["depth"] == 0  # noqa: S101
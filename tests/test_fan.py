@@ -0,0 +1,46 @@
+"""Tests for the Flashforge fans."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+import pytest
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+
+from . import init_integration
+
+EXTERNAL_FAN = "fan.adventurer4_external_filtration"
+INTERNAL_FAN = "fan.adventurer4_internal_filtration"
+
+
+@pytest.mark.asyncio
+async def test_filtration_fans_optimistic_state(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a filtration command shows its expected result on both fans."""
+    client = mock_flashforge_client.return_value
+    client.filtration_control = True
+    client.get_printer_status.return_value = (
+        client.get_printer_status.return_value.model_copy(
+            update={"internal_fan_on": True}
+        )
+    )
+    control = MagicMock(set_external_filtration_on=AsyncMock(return_value=True))
+    type(client).control = PropertyMock(return_value=control)
+    await init_integration(hass)
+    for entity_id, expected in ((EXTERNAL_FAN, STATE_OFF), (INTERNAL_FAN, STATE_ON)):
+        state = hass.states.get(entity_id)
+        assert state is not None  # noqa: S101
+        assert state.state == expected  # noqa: S101
+
+    await hass.data["entity_components"]["fan"].get_entity(EXTERNAL_FAN).async_turn_on()
+    await hass.async_block_till_done()
+
+    # Turning on the external fan turns off the internal one
+    control.set_external_filtration_on.assert_awaited_once()
+    for entity_id, expected in ((EXTERNAL_FAN, STATE_ON), (INTERNAL_FAN, STATE_OFF)):
+        state = hass.states.get(entity_id)
+        assert state is not None  # noqa: S101
+        assert state.state == expected  # noqa: S101
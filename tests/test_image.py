@@ -0,0 +1,40 @@
+"""Tests for the Flashforge print thumbnail."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.flashforge.const import DOMAIN
+
+from . import init_integration
+
+ENTITY_ID = "image.adventurer4_print_thumbnail"
+
+
+@pytest.mark.asyncio
+async def test_thumbnail_fetched_late(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a thumbnail fetched after its file started printing refreshes the image."""
+    files = mock_flashforge_client.return_value.files
+    files.get_gcode_thumbnail = AsyncMock(return_value=None)
+    entry = await init_integration(hass)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    image = hass.data["entity_components"]["image"].get_entity(ENTITY_ID)
+    before = image.image_last_updated
+
+    files.get_gcode_thumbnail.return_value = b"png"
+    # Past the interval in which a missing thumbnail is not asked for again
+    with patch(
+        "custom_components.flashforge.thumbnail_cache.monotonic", return_value=1e9
+    ):
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.data.thumbnail == b"png"  # noqa: S101
+    # A new time gives the frontend a new image URL
+    assert image.image_last_updated > before  # noqa: S101
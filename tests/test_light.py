@@ -0,0 +1,102 @@
+"""Tests for the Flashforge light."""
+
+import asyncio
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_ON, STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+
+from custom_components.flashforge.const import DOMAIN, OPTIMISTIC_CONFIRM_WINDOW
+
+from . import init_integration
+
+if TYPE_CHECKING:
+    from custom_components.flashforge.data_update_coordinator import (
+        FlashForgeDataUpdateCoordinator,
+    )
+
+ENTITY_ID = "light.adventurer4_light"
+
+
+@pytest.mark.asyncio
+async def test_light_optimistic_state(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test the light shows its target state until a poll confirms or reverts it."""
+    client = mock_flashforge_client.return_value
+    client.tcp_client = MagicMock(led_on=AsyncMock(return_value=True))
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None  # noqa: S101
+    assert state.state == STATE_OFF  # noqa: S101
+    polls = client.get_printer_status.await_count
+
+    await hass.services.async_call(
+        LIGHT_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: ENTITY_ID}, blocking=True
+    )
+
+    # Shown at once, without forcing a poll.
+    client.tcp_client.led_on.assert_awaited_once()
+    assert client.get_printer_status.await_count == polls  # noqa: S101
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None  # noqa: S101
+    assert state.state == STATE_ON  # noqa: S101
+
+    # A poll that does not show the change yet keeps the target state...
+    await coordinator.async_refresh()
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None  # noqa: S101
+    assert state.state == STATE_ON  # noqa: S101
+
+    # ...until the confirmation window has passed.
+    with patch(
+        "custom_components.flashforge.data_update_coordinator.monotonic",
+        return_value=monotonic() + OPTIMISTIC_CONFIRM_WINDOW,
+    ):
+        await coordinator.async_refresh()
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None  # noqa: S101
+    assert state.state == STATE_OFF  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_light_optimistic_before_command(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test the target state shows while the command waits, and reverts if it fails."""
+    sent = asyncio.Event()
+
+    async def _led_on() -> bool:
+        await sent.wait()
+        msg = "printer went away"
+        raise ConnectionError(msg)
+
+    client = mock_flashforge_client.return_value
+    client.tcp_client = MagicMock(led_on=AsyncMock(side_effect=_led_on))
+    await init_integration(hass)
+
+    call = hass.async_create_task(
+        hass.services.async_call(
+            LIGHT_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: ENTITY_ID}, blocking=True
+        )
+    )
+    await asyncio.sleep(0.01)
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None  # noqa: S101
+    assert state.state == STATE_ON  # noqa: S101
+
+    sent.set()
+    with pytest.raises(ConnectionError):
+        await call
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None  # noqa: S101
+    assert state.state == STATE_OFF  # noqa: S101
@@ -0,0 +1,52 @@
+"""Tests for the Flashforge MJPEG parser."""
+
+from custom_components.flashforge.mjpeg import MjpegParser
+
+FRAME = b"\xff\xd8jpeg-data\xff\xd9"
+# A frame embedding a thumbnail, with an End-of-Image marker before its own
+NESTED_FRAME = b"\xff\xd8exif\xff\xd8thumb\xff\xd9image\xff\xd9"
+
+
+def _part(frame: bytes, *, length: bool = True) -> bytes:
+    """Return a multipart section holding one frame."""
+    headers = b"--frame\r\nContent-Type: image/jpeg\r\n"
+    if length:
+        headers += b"Content-Length: %d\r\n" % len(frame)
+    return headers + b"\r\n" + frame + b"\r\n"
+
+
+def test_frames_split_across_chunks() -> None:
+    """Test frames are found whatever the chunk boundaries, even mid-marker."""
+    stream = _part(FRAME, length=False) * 3
+    parser = MjpegParser()
+
+    frames = [
+        frame for i in range(len(stream)) for frame in parser.feed(stream[i : i + 1])
+    ]
+
+    assert frames == [FRAME] * 3  # noqa: S101
+
+
+def test_content_length_honoured() -> None:
+    """Test the announced length keeps an embedded marker from cutting a frame."""
+    parser = MjpegParser()
+
+    assert parser.feed(_part(NESTED_FRAME) + _part(FRAME)) == [  # noqa: S101
+        NESTED_FRAME,
+        FRAME,
+    ]
+
+
+def test_wrong_content_length_falls_back_to_markers() -> None:
+    """Test a length that does not end on a marker is ignored."""
+    stream = b"--frame\r\nContent-Length: 5\r\n\r\n" + FRAME + b"\r\n"
+
+    assert MjpegParser().feed(stream) == [FRAME]  # noqa: S101
+
+
+def test_oversized_garbage_dropped() -> None:
+    """Test data without a frame does not grow the buffer without bound."""
+    parser = MjpegParser(max_frame_size=64)
+
+    assert parser.feed(b"\xff\xd8" + b"x" * 100) == []  # noqa: S101
+    assert parser.feed(_part(FRAME)) == [FRAME]  # noqa: S101
@@ -0,0 +1,39 @@
+"""Tests for the Flashforge fleet scheduler."""
+
+import asyncio
+from itertools import pairwise
+
+import pytest
+
+from custom_components.flashforge.scheduler import FleetScheduler
+
+
+def test_phases_spread() -> None:
+    """Test printers registered together get distinct, spread out phases."""
+    fleet = FleetScheduler()
+    phases = sorted(fleet.async_register() for _ in range(8))
+
+    assert all(0 <= phase < 1 for phase in phases)  # noqa: S101
+    gaps = [b - a for a, b in pairwise(phases)]
+    assert min(gaps) > 0.05  # noqa: S101, PLR2004
+    assert fleet.printers == 8  # noqa: S101, PLR2004
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_capped() -> None:
+    """Test no more requests than the cap are in flight across the fleet."""
+    fleet = FleetScheduler(max_concurrent=2)
+    peak = 0
+
+    async def request() -> None:
+        nonlocal peak
+        async with fleet.async_request():
+            peak = max(peak, fleet.in_flight)
+            await asyncio.sleep(0)
+        fleet.async_record_poll()
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert peak == 2  # noqa: S101, PLR2004
+    assert fleet.in_flight == 0  # noqa: S101
+    assert fleet.stats()["polls_per_minute"] == 6  # noqa: S101, PLR2004
@@ -0,0 +1,72 @@
+"""Tests for the Flashforge selects."""
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.components.text import ATTR_VALUE, SERVICE_SET_VALUE
+from homeassistant.components.text import DOMAIN as TEXT_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+
+from custom_components.flashforge.const import DOMAIN
+
+from . import init_integration
+
+if TYPE_CHECKING:
+    from custom_components.flashforge.data_update_coordinator import (
+        FlashForgeDataUpdateCoordinator,
+    )
+
+SELECT_ID = "select.adventurer4_file_list"
+FILTER_ID = "text.adventurer4_file_filter"
+
+
+@pytest.mark.asyncio
+async def test_file_select_window(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test the file select offers a bounded window that follows the filter."""
+    mock_flashforge_client.return_value.files.get_local_file_list.return_value = [
+        f"/data/part{i}.gcode" for i in range(5)
+    ] + ["/data/test.gcode", "/data/cube.gcode"]
+    with patch("custom_components.flashforge.select.FILE_SELECT_WINDOW", 3):
+        await init_integration(hass)
+
+        assert len(hass.states.get(SELECT_ID).attributes["options"]) == 3  # noqa: S101, PLR2004
+
+        await hass.services.async_call(
+            TEXT_DOMAIN,
+            SERVICE_SET_VALUE,
+            {ATTR_ENTITY_ID: FILTER_ID, ATTR_VALUE: "cube"},
+            blocking=True,
+        )
+
+    state = hass.states.get(SELECT_ID)
+    assert state.attributes["options"] == ["cube.gcode"]  # noqa: S101
+    assert state.state == "cube.gcode"  # noqa: S101
+    assert hass.states.get(FILTER_ID).state == "cube"  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_file_select_follows_use(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a file that was just used moves to the front of the options."""
+    mock_flashforge_client.return_value.files.get_local_file_list.return_value = [
+        "/data/cube.gcode",
+        "/data/part.gcode",
+    ]
+    entry = await init_integration(hass)
+    coordinator: FlashForgeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    assert hass.states.get(SELECT_ID).attributes["options"][0] == "cube.gcode"  # noqa: S101
+
+    # The file list is unchanged; only the order of use is
+    coordinator.catalog.async_mark_used("part.gcode")
+    await coordinator.async_refresh()
+
+    assert hass.states.get(SELECT_ID).attributes["options"][0] == "part.gcode"  # noqa: S101
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
 import pytest
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
@@ -190,3 +191,35 @@ async def test_sensor_update_error2(
         state = hass.states.get(sensor["entity_id"])
         assert state is not None  # noqa: S101
         assert state.state == STATE_UNAVAILABLE  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_sensor_skips_unchanged_state(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test sensors only write their state when their fields changed."""
+    entry = await init_integration(hass)
+    coordinator: DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    status = hass.states.get("sensor.adventurer4_status")
+    layer = hass.states.get("sensor.adventurer4_current_layer")
+    assert status is not None  # noqa: S101
+    assert layer is not None  # noqa: S101
+
+    info = mock_flashforge_client.return_value.get_printer_status.return_value
+    mock_flashforge_client.return_value.get_printer_status.return_value = (
+        info.model_copy(update={"current_print_layer": 11})
+    )
+    freezer.tick(1)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    new_status = hass.states.get("sensor.adventurer4_status")
+    new_layer = hass.states.get("sensor.adventurer4_current_layer")
+    assert new_status is not None  # noqa: S101
+    assert new_layer is not None  # noqa: S101
+    assert new_status.last_reported == status.last_reported  # noqa: S101
+    assert new_layer.state == "11"  # noqa: S101
+    assert new_layer.last_changed > layer.last_changed  # noqa: S101
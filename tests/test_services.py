@@ -0,0 +1,69 @@
+"""Tests for the Flashforge services."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.flashforge.const import (
+    ATTR_FILE_NAME,
+    ATTR_LEVELING_BEFORE_PRINT,
+    DOMAIN,
+    SERVICE_PRINT_FILE,
+)
+
+from . import init_fleet
+
+
+@pytest.mark.asyncio
+async def test_print_file_on_many_printers(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test one call starts a stored file on every targeted printer."""
+    client = mock_flashforge_client.return_value
+    client.files.get_local_file_list.return_value = ["/data/cube.gcode"]
+    client.job_control.print_local_file = AsyncMock(return_value=True)
+    devices = await init_fleet(hass)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PRINT_FILE,
+        {
+            ATTR_DEVICE_ID: devices,
+            ATTR_FILE_NAME: "cube.gcode",
+            ATTR_LEVELING_BEFORE_PRINT: True,
+        },
+        blocking=True,
+    )
+
+    assert client.job_control.print_local_file.await_count == 2  # noqa: S101, PLR2004
+    client.job_control.print_local_file.assert_awaited_with(
+        file_name="cube.gcode", leveling_before_print=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_print_file_not_in_catalog(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a file missing from a printer starts no print anywhere."""
+    client = mock_flashforge_client.return_value
+    client.job_control.print_local_file = AsyncMock(return_value=True)
+    devices = await init_fleet(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PRINT_FILE,
+            {ATTR_DEVICE_ID: devices, ATTR_FILE_NAME: "missing.gcode"},
+            blocking=True,
+        )
+
+    client.job_control.print_local_file.assert_not_awaited()
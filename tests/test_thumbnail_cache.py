@@ -0,0 +1,55 @@
+"""Tests for the Flashforge thumbnail cache."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.flashforge.thumbnail_cache import ThumbnailCache, ThumbnailKey
+
+
+def test_lru_eviction() -> None:
+    """Test the least recently used thumbnails are evicted over budget."""
+    cache = ThumbnailCache(max_bytes=10)
+    first = ThumbnailKey("first.gcode", 100)
+    second = ThumbnailKey("second.gcode", 100)
+    third = ThumbnailKey("third.gcode", 100)
+
+    cache.put(first, b"1234")
+    cache.put(second, b"1234")
+    assert cache.get(first) == b"1234"  # noqa: S101
+    cache.put(third, b"1234")
+
+    assert first in cache  # noqa: S101
+    assert second not in cache  # noqa: S101
+    assert third in cache  # noqa: S101
+    assert cache.size == 8  # noqa: S101, PLR2004
+
+
+@pytest.mark.asyncio
+async def test_fetch_once() -> None:
+    """Test a thumbnail is fetched from the printer only once."""
+    cache = ThumbnailCache()
+    fetch = AsyncMock(return_value=b"png")
+    key = ThumbnailKey("cube.gcode", 42)
+
+    for _ in range(5):
+        assert await cache.async_get_or_fetch(key, fetch) == b"png"  # noqa: S101
+
+    assert fetch.await_count == 1  # noqa: S101
+    assert cache.hits == 4  # noqa: S101, PLR2004
+
+    # A re-sliced file with the same name is fetched again.
+    await cache.async_get_or_fetch(ThumbnailKey("cube.gcode", 43), fetch)
+    assert fetch.await_count == 2  # noqa: S101, PLR2004
+
+
+@pytest.mark.asyncio
+async def test_missing_thumbnail_not_refetched() -> None:
+    """Test a file without a thumbnail is not asked for on every poll."""
+    cache = ThumbnailCache()
+    fetch = AsyncMock(return_value=None)
+    key = ThumbnailKey("cube.gcode", 42)
+
+    assert await cache.async_get_or_fetch(key, fetch) is None  # noqa: S101
+    assert await cache.async_get_or_fetch(key, fetch) is None  # noqa: S101
+    assert fetch.await_count == 1  # noqa: S101
@@ -0,0 +1,190 @@
+"""Tests for the Flashforge upload service."""
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.flashforge.const import (
+    ATTR_FILE_PATH,
+    DOMAIN,
+    EVENT_UPLOAD_PROGRESS,
+    SERVICE_UPLOAD_FILE,
+)
+from custom_components.flashforge.upload import async_read_chunks
+
+from . import init_fleet, init_integration
+
+CONTENT = b"G28\n" * 100_000
+
+
+async def _upload(request: web.Request) -> web.Response:
+    """Receive a file like the printer does."""
+    async for part in await request.multipart():
+        request.app["uploads"][part.filename] = await part.read()
+    request.app["headers"] = request.headers
+    request.app["requests"] += 1
+    if request.app["failures"]:
+        request.app["failures"] -= 1
+        return web.Response(status=500)
+    return web.Response(text='{"code": 0, "message": "Success"}')
+
+
+@pytest_asyncio.fixture
+async def printer_server(socket_enabled: Any) -> AsyncGenerator[TestServer]:  # noqa: ARG001
+    """Serve the upload endpoint of the printer."""
+    app = web.Application()
+    app["uploads"] = {}
+    app["requests"] = 0
+    app["failures"] = 0
+    app.router.add_post("/uploadGcode", _upload)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_upload_file(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    printer_server: TestServer,
+    tmp_path: Path,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a file is streamed to the printer with progress and verified."""
+    client = mock_flashforge_client.return_value
+    client.get_endpoint.side_effect = lambda path: str(printer_server.make_url(path))
+    client.check_code = ""
+    client.firmware_ver = "3.1.3"
+    entry = await init_integration(hass)
+    device = dr.async_entries_for_config_entry(dr.async_get(hass), entry.entry_id)[0]
+    path = tmp_path / "cube.gcode"
+    path.write_bytes(CONTENT)
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    client.files.get_local_file_list.return_value = ["/data/cube.gcode"]
+    events: list[Event] = []
+    hass.bus.async_listen(EVENT_UPLOAD_PROGRESS, events.append)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_UPLOAD_FILE,
+        {ATTR_DEVICE_ID: device.id, ATTR_FILE_PATH: str(path)},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert printer_server.app["uploads"] == {"cube.gcode": CONTENT}  # noqa: S101
+    assert printer_server.app["headers"]["fileSize"] == str(len(CONTENT))  # noqa: S101
+    # A sized body like the library sends, not a chunked one
+    assert "Transfer-Encoding" not in printer_server.app["headers"]  # noqa: S101
+    assert printer_server.app["headers"]["Expect"] == "100-continue"  # noqa: S101
+    assert int(printer_server.app["headers"]["Content-Length"]) > len(CONTENT)  # noqa: S101
+    progress = [event.data["progress"] for event in events]
+    assert 1 < len(progress) <= 21  # noqa: S101, PLR2004
+    assert progress[-1] == 100  # noqa: S101, PLR2004
+
+
+@pytest.mark.asyncio
+async def test_upload_file_unverified(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    printer_server: TestServer,
+    tmp_path: Path,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test a file list that cannot be fetched is not reported as a failed upload."""
+    client = mock_flashforge_client.return_value
+    client.get_endpoint.side_effect = lambda path: str(printer_server.make_url(path))
+    client.check_code = ""
+    client.firmware_ver = "3.1.3"
+    entry = await init_integration(hass)
+    device = dr.async_entries_for_config_entry(dr.async_get(hass), entry.entry_id)[0]
+    path = tmp_path / "cube.gcode"
+    path.write_bytes(CONTENT)
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    client.files.get_local_file_list.side_effect = TimeoutError
+
+    with pytest.raises(HomeAssistantError, match="could not be fetched"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_UPLOAD_FILE,
+            {ATTR_DEVICE_ID: device.id, ATTR_FILE_PATH: str(path)},
+            blocking=True,
+        )
+
+    # The printer took the file; it is not sent again
+    assert printer_server.app["requests"] == 1  # noqa: S101
+
+
+@pytest.mark.asyncio
+async def test_upload_file_not_allowed(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,  # noqa: ARG001
+    tmp_path: Path,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test files outside the allowed directories are refused."""
+    entry = await init_integration(hass)
+    device = dr.async_entries_for_config_entry(dr.async_get(hass), entry.entry_id)[0]
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_UPLOAD_FILE,
+            {ATTR_DEVICE_ID: device.id, ATTR_FILE_PATH: str(tmp_path / "x.gcode")},
+            blocking=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_upload_file_to_fleet(
+    hass: HomeAssistant,
+    mock_flashforge_client: MagicMock,
+    printer_server: TestServer,
+    tmp_path: Path,
+    enable_custom_integrations: Any,  # noqa: ARG001
+) -> None:
+    """Test printers share one read of the file and retry on their own."""
+    client = mock_flashforge_client.return_value
+    client.get_endpoint.side_effect = lambda path: str(printer_server.make_url(path))
+    client.check_code = ""
+    client.firmware_ver = "2.0.9"
+    devices = await init_fleet(hass)
+    path = tmp_path / "cube.gcode"
+    path.write_bytes(CONTENT)
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    client.files.get_local_file_list.return_value = ["/data/cube.gcode"]
+    printer_server.app["failures"] = 1
+
+    with (
+        patch("custom_components.flashforge.upload.UPLOAD_RETRY_DELAY", 0),
+        patch(
+            "custom_components.flashforge.upload.async_read_chunks",
+            wraps=async_read_chunks,
+        ) as read_chunks,
+    ):
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_UPLOAD_FILE,
+            {ATTR_DEVICE_ID: devices, ATTR_FILE_PATH: str(path)},
+            blocking=True,
+            return_response=True,
+        )
+
+    results = response["printers"].values()
+    assert all(result["success"] for result in results)  # noqa: S101
+    assert sorted(result["attempts"] for result in results) == [1, 2]  # noqa: S101
+    assert printer_server.app["requests"] == 3  # noqa: S101, PLR2004
+    assert printer_server.app["uploads"] == {"cube.gcode": CONTENT}  # noqa: S101
+    # One read shared by both printers, and one for the retry
+    assert read_chunks.call_count == 2  # noqa: S101, PLR2004